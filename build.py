@@ -5,12 +5,22 @@ Simple cross-platform build script for MQTT Audio Player
 
 import os
 import sys
+import hashlib
 import shutil
 import subprocess
 import platform
 from pathlib import Path
 
 
+# Native libs that are already compressed or break when packed with UPX
+UPX_EXCLUDES = [
+    "vcruntime140.dll",
+    "python3.dll",
+    "libportaudio*",
+    "_sounddevice_data*",
+]
+
+
 class BuildManager:
     def __init__(self):
         self.project_root = Path(__file__).parent
@@ -28,38 +38,95 @@ class BuildManager:
         """Build the executable using PyInstaller"""
         print("🔨 Building executable...")
         
-        # Simple PyInstaller command - let it auto-detect everything
+        # Simple PyInstaller command - let it auto-detect everything.
+        # --onedir avoids unpacking the whole bundle to a temp dir on every launch
         cmd = [
             "uv", "run", "pyinstaller", 
-            "--onefile",
+            "--onedir",
             "--name", "audio-player",
             "--add-data", "config.yaml:.",
             "--add-data", "audio:audio",
-            "main.py"
         ]
         
+        # Compress binaries with UPX only when it is installed
+        upx_path = shutil.which("upx")
+        if upx_path:
+            print(f"📦 Using UPX from: {upx_path}")
+            cmd += ["--upx-dir", str(Path(upx_path).parent)]
+            for pattern in UPX_EXCLUDES:
+                cmd += ["--upx-exclude", pattern]
+        else:
+            cmd.append("--noupx")
+        
+        cmd.append("main.py")
+        
         subprocess.run(cmd, check=True)
         
     def copy_to_root(self):
-        """Copy the built executable to project root for easy access"""
+        """Copy the built bundle folder to project root for easy access"""
         exe_name = "audio-player"
         if platform.system() == "Windows":
             exe_name += ".exe"
             
-        src = self.dist_dir / exe_name
-        dst = self.project_root / exe_name
+        src_dir = self.dist_dir / "audio-player"
+        dst_dir = self.project_root / "audio-player"
         
-        if src.exists():
-            shutil.copy2(src, dst)
+        if (src_dir / exe_name).exists():
+            copied, skipped = self.sync_tree(src_dir, dst_dir)
+            print(f"📁 Copied {copied} file(s), {skipped} unchanged")
             # Make executable on Unix
             if platform.system() != "Windows":
-                os.chmod(dst, 0o755)
-            print(f"✅ Executable ready: ./{exe_name}")
+                os.chmod(dst_dir / exe_name, 0o755)
+            print(f"✅ Executable ready: ./audio-player/{exe_name}")
             return True
         else:
             print("❌ Build failed - no executable found")
             return False
         
+    def sync_tree(self, src_dir, dst_dir):
+        """Mirror src_dir into dst_dir, copying only files whose content changed"""
+        copied = skipped = 0
+        src_files = set()
+        
+        for src in src_dir.rglob("*"):
+            if src.is_dir():
+                continue
+            rel = src.relative_to(src_dir)
+            src_files.add(rel)
+            dst = dst_dir / rel
+            
+            if self._files_identical(src, dst):
+                skipped += 1
+                continue
+            
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            # copyfile uses sendfile/copy_file_range where the OS supports it
+            shutil.copyfile(src, dst)
+            shutil.copystat(src, dst)
+            copied += 1
+        
+        # Drop files left over from a previous build
+        for dst in list(dst_dir.rglob("*")):
+            if dst.is_file() and dst.relative_to(dst_dir) not in src_files:
+                dst.unlink()
+        
+        return copied, skipped
+    
+    @staticmethod
+    def _files_identical(src, dst):
+        """Check size first, then SHA-256, to see if dst already matches src"""
+        if not dst.is_file() or dst.stat().st_size != src.stat().st_size:
+            return False
+        
+        def digest(path):
+            h = hashlib.sha256()
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    h.update(chunk)
+            return h.digest()
+        
+        return digest(src) == digest(dst)
+        
     def build(self):
         """Main build process"""
         try:
@@ -82,6 +149,6 @@ if __name__ == "__main__":
     if success:
         print("🎉 Build complete!")
         exe_name = "audio-player.exe" if platform.system() == "Windows" else "audio-player"
-        print(f"🚀 Run with: ./{exe_name}")
+        print(f"🚀 Run with: ./audio-player/{exe_name}")
     
     sys.exit(0 if success else 1)
\ No newline at end of file
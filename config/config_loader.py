@@ -3,10 +3,33 @@ Configuration loading and management module.
 Handles YAML config loading with Jinja2 templating.
 """
 
+import json
+import os
 import yaml
-from jinja2 import Template
+from dataclasses import dataclass
+from functools import lru_cache
+from jinja2 import Environment
 from pathlib import Path
 
+# Prefer libyaml's C parser, fall back to the pure-Python one if unavailable
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Parsed config is cached in a JSON sidecar next to the YAML file
+# (e.g. config.yaml.cache.json) and reused while the YAML is unchanged
+CONFIG_CACHE_SUFFIX = ".cache.json"
+
+# Shared Jinja2 environment, so templates aren't compiled with a fresh one each time
+_JINJA_ENV = Environment()
+
+
+@lru_cache(maxsize=128)
+def _compile_template(source):
+    """Compile a template string once and reuse it for identical sources"""
+    return _JINJA_ENV.from_string(source)
+
 def load_config(config_file=None):
     """
     Load and process configuration file with Jinja2 templating.
@@ -29,22 +52,88 @@ def load_config(config_file=None):
         if not config_file.exists():
             raise FileNotFoundError(f"Config file not found: {config_file}")
         
+    # Reuse the cached result if the config file hasn't changed since last parse
+    cache_key = _config_cache_key(config_file)
+    cached = _read_config_cache(config_file, cache_key)
+    if cached is not None:
+        return cached
+
     with open(config_file, "r") as file:
         config_str = file.read()
 
-    config_unrendered = yaml.safe_load(config_str)
+    config_unrendered = yaml.load(config_str, Loader=SafeLoader)
 
     # Extract basic configs
     logging_config = config_unrendered["logging"]
     paths_config = config_unrendered["paths"]
     player_config = config_unrendered["player"]
 
-    # Process MQTT config with Jinja2 templating
-    mqtt_template = Template(config_str)
-    rendered_mqtt_info = mqtt_template.render(mqtt=config_unrendered["mqtt"])
-    mqtt_config = yaml.safe_load(rendered_mqtt_info)["mqtt"]
+    # Process MQTT config with Jinja2 templating (only templated values are rendered)
+    mqtt_unrendered = config_unrendered["mqtt"]
+    mqtt_config = _render_templated_values(mqtt_unrendered, mqtt_unrendered)
+
+    result = (logging_config, paths_config, player_config, mqtt_config)
+    _write_config_cache(config_file, cache_key, result)
+    return result
+
+
+def _config_cache_key(config_file):
+    """Identify a config file revision by its mtime and size"""
+    stats = config_file.stat()
+    return [stats.st_mtime_ns, stats.st_size]
+
+
+def _config_cache_path(config_file):
+    """Path of the JSON sidecar cache for config_file"""
+    return config_file.with_name(config_file.name + CONFIG_CACHE_SUFFIX)
 
-    return logging_config, paths_config, player_config, mqtt_config
+
+def _read_config_cache(config_file, cache_key):
+    """Return cached config tuple if the sidecar matches cache_key, else None"""
+    try:
+        with open(_config_cache_path(config_file), "r", encoding="utf-8") as file:
+            cached = json.load(file)
+        if cached["source_key"] != cache_key:
+            return None
+        return tuple(cached["config"])
+    except Exception:
+        return None
+
+
+def _write_config_cache(config_file, cache_key, result):
+    """Store parsed config tuple for the next start (best effort)"""
+    cache_path = _config_cache_path(config_file)
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    try:
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump({"source_key": cache_key, "config": list(result)}, file)
+        # Atomic swap so a concurrent start never reads a half-written cache
+        os.replace(tmp_path, cache_path)
+    except Exception:
+        # A missing cache (e.g. read-only config dir) only costs a re-parse
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
+def _render_templated_values(value, mqtt):
+    """
+    Recursively render Jinja2 placeholders in string values.
+    Strings without template markers are returned untouched, so the
+    template engine only runs for the few values that need it.
+    """
+    if isinstance(value, dict):
+        return {k: _render_templated_values(v, mqtt) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_render_templated_values(v, mqtt) for v in value]
+    if isinstance(value, str) and ("{{" in value or "{%" in value):
+        return _compile_template(value).render(mqtt=mqtt)
+    return value
+
+
+# String values treated as True by _parse_boolean_config
+_TRUTHY_STRINGS = frozenset({"true", "1", "yes", "on"})
 
 
 def _parse_boolean_config(value):
@@ -52,10 +141,25 @@ def _parse_boolean_config(value):
     if isinstance(value, bool):
         return value
     if isinstance(value, str):
-        return value.upper() in ["TRUE", "1", "YES", "ON"]
+        return value.strip().lower() in _TRUTHY_STRINGS
     return bool(value)
 
 
+@dataclass(slots=True)
+class PlayerSettings:
+    """Resolved player settings (see get_player_settings for the source keys)"""
+    device_name: str
+    sample_rate: int
+    volume: float
+    channels: int
+    channel_mask: list
+    auto_start: bool
+    audio_level_enabled: bool
+    stream_blocksize: int
+    stream_latency: object  # 'low', 'high' or seconds
+    resample_cache_max_mb: int  # 0 = resample cache disabled
+
+
 def get_player_settings(player_config):
     """
     Extract player-specific settings from config.
@@ -72,6 +176,9 @@ def get_player_settings(player_config):
         "audio_level_enabled": _parse_boolean_config(
             player_config.get("audio_level_enabled", False)
         ),
+        "stream_blocksize": int(player_config.get("stream_blocksize", 1024)),
+        "stream_latency": player_config.get("stream_latency", "high"),
+        "resample_cache_max_mb": int(player_config.get("resample_cache_max_mb", 0)),
     }
 
 
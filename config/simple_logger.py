@@ -5,11 +5,26 @@ Creates one log file named: {client_id}_{timestamp}.log
 
 # import os
 # import sys
+import os
+import queue
 import threading
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 import re
+import time
+
+# ANSI escape sequences (colorama colors, cursor control)
+_ANSI_ESCAPE_RE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
+# Max number of queued messages written to disk in one batch
+_WRITE_BATCH_SIZE = 64
+
+# How long the writer keeps collecting messages before writing a batch (seconds)
+_WRITE_COALESCE_INTERVAL = 0.2
+
+# Lines written between file size checks (rotation doesn't need per-line precision)
+_ROTATION_CHECK_LINES = 256
 
 class ConsoleFileLogger:
     """
@@ -19,12 +34,18 @@ class ConsoleFileLogger:
     
     def __init__(self):
         self.log_file = None
+        self._log_handle = None  # Kept open between writes
         self.log_dir = None
         self.client_id = None
         self.max_size_mb = 5
-        self.current_size = 0
+        self._lines_since_size_check = 0
         self._lock = threading.Lock()
         self.is_active = False
+        self._queue = None  # Messages waiting for the writer thread
+        self._writer_thread = None
+        self._last_timestamp = (None, "")  # (epoch second, formatted string)
+        self._log_files_cache = None  # get_log_files() result for the dir state below
+        self._log_files_cache_mtime = -1
         
     def setup(self, client_id: str, log_dir: str = "logs", max_size_mb: int = 5):
         """
@@ -45,68 +66,134 @@ class ConsoleFileLogger:
         self._create_new_log_file()
         self.is_active = True
         
+        # Disk writes happen on a background thread so callers never block on I/O
+        self._queue = queue.SimpleQueue()
+        self._writer_thread = threading.Thread(target=self._writer_loop, daemon=True)
+        self._writer_thread.start()
+        
         # Log the startup
         self._write_to_file(f"[{self._timestamp()}] Logger started for client: {client_id}")
         
     def _timestamp(self):
-        """Get current timestamp string"""
-        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        """Get current timestamp string (formatted at most once per second)"""
+        now = time.time()
+        second = int(now)
+        cached_second, cached_str = self._last_timestamp
+        if second != cached_second:
+            cached_str = datetime.fromtimestamp(now).strftime("%Y-%m-%d %H:%M:%S")
+            self._last_timestamp = (second, cached_str)
+        return cached_str
     
     def _create_new_log_file(self):
         """Create a new log file with timestamp"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filename = f"{self.client_id}_{timestamp}.log"
         self.log_file = self.log_dir / filename
-        self.current_size = 0
+        self._lines_since_size_check = 0
+        
+        # Close previous file (rotation) and keep the new one open.
+        # Line buffering flushes every message without reopening the file.
+        self._close_log_handle()
+        self._log_handle = open(self.log_file, 'w', encoding='utf-8', buffering=1)
         
         # Write header to new file
-        with open(self.log_file, 'w', encoding='utf-8') as f:
-            f.write(f"=== Audio Player Log - {self.client_id} ===\n")
-            f.write(f"Started: {self._timestamp()}\n")
-            f.write("=" * 50 + "\n\n")
+        self._log_handle.write(f"=== Audio Player Log - {self.client_id} ===\n")
+        self._log_handle.write(f"Started: {self._timestamp()}\n")
+        self._log_handle.write("=" * 50 + "\n\n")
+    
+    def _close_log_handle(self):
+        """Close the open log file handle, if any"""
+        if self._log_handle is not None:
+            try:
+                self._log_handle.close()
+            except Exception:
+                pass
+            self._log_handle = None
     
     def _check_rotation(self):
         """Check if file needs rotation and rotate if necessary"""
-        if self.current_size > (self.max_size_mb * 1024 * 1024):
+        if self._lines_since_size_check < _ROTATION_CHECK_LINES:
+            return
+        self._lines_since_size_check = 0
+        
+        # Size as seen by the OS (file is flushed after every batch)
+        current_size = os.fstat(self._log_handle.fileno()).st_size
+        if current_size > (self.max_size_mb * 1024 * 1024):
             old_file = self.log_file.name
-            self._write_to_file(f"[{self._timestamp()}] Log rotation - file size exceeded {self.max_size_mb}MB")
+            self._write_lines([f"[{self._timestamp()}] Log rotation - file size exceeded {self.max_size_mb}MB"])
             self._create_new_log_file()
-            self._write_to_file(f"[{self._timestamp()}] Log rotated from: {old_file}")
+            self._write_lines([f"[{self._timestamp()}] Log rotated from: {old_file}"])
     
     def _clean_ansi_codes(self, text: str) -> str:
         """Remove ANSI color codes from text"""
-        # Remove ANSI escape sequences
-        ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-        return ansi_escape.sub('', text)
+        # Plain lines carry no escape character, skip the regex for them
+        if '\x1b' not in text:
+            return text
+        return _ANSI_ESCAPE_RE.sub('', text)
     
     def _write_to_file(self, message: str):
-        """Write message to log file (thread-safe)"""
+        """Queue message for the writer thread (thread-safe, non-blocking)"""
+        self._write_to_file_raw(self._clean_ansi_codes(message))
+    
+    def _write_to_file_raw(self, clean_message: str):
+        """Queue an already ANSI-cleaned message for the writer thread"""
         if not self.is_active or not self.log_file:
             return
             
-        with self._lock:
-            try:
-                # Clean message of ANSI codes
-                clean_message = self._clean_ansi_codes(message)
-                
-                # Add timestamp if not already present
-                if not clean_message.startswith('['):
-                    clean_message = f"[{self._timestamp()}] {clean_message}"
-                
-                # Write to file
-                with open(self.log_file, 'a', encoding='utf-8') as f:
-                    f.write(clean_message + '\n')
-                    f.flush()  # Ensure immediate write
-                
-                # Update size tracking
-                self.current_size += len(clean_message.encode('utf-8')) + 1
-                
-                # Check for rotation
-                self._check_rotation()
-                
-            except Exception as e:
-                # Don't let logging errors crash the app
-                pass
+        try:
+            # Add timestamp if not already present
+            if not clean_message.startswith('['):
+                clean_message = f"[{self._timestamp()}] {clean_message}"
+            
+            self._queue.put(clean_message)
+            
+        except Exception as e:
+            # Don't let logging errors crash the app
+            pass
+    
+    def _write_lines(self, lines: list):
+        """Write a batch of lines to the log file with a single write call"""
+        data = '\n'.join(lines) + '\n'
+        
+        # Line buffered file, so this flushes once per batch
+        self._log_handle.write(data)
+        self._lines_since_size_check += len(lines)
+    
+    def _writer_loop(self):
+        """Drain queued messages to disk in batches until the stop sentinel arrives"""
+        running = True
+        while running:
+            batch = [self._queue.get()]
+            
+            # Keep collecting for a short window so bursts of prints become one write.
+            # Stops early when the batch is full or shutdown (None) arrives.
+            deadline = time.monotonic() + _WRITE_COALESCE_INTERVAL
+            while len(batch) < _WRITE_BATCH_SIZE and batch[-1] is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            
+            if None in batch:
+                running = False
+                batch = batch[:batch.index(None)]
+            
+            if not batch:
+                continue
+            
+            with self._lock:
+                try:
+                    self._write_lines(batch)
+                    
+                    # Check for rotation
+                    self._check_rotation()
+                    
+                except Exception as e:
+                    # Don't let logging errors crash the app
+                    pass
     
     def log(self, message: str):
         """Log a message (public interface)"""
@@ -116,36 +203,67 @@ class ConsoleFileLogger:
         """Log a message that was printed to console"""
         # Extract the actual message content for cleaner logs
         clean_message = self._clean_ansi_codes(message)
-        self._write_to_file(clean_message)
+        self._write_to_file_raw(clean_message)
     
     def cleanup(self):
         """Cleanup and close logger"""
         if self.is_active:
             self._write_to_file(f"[{self._timestamp()}] Logger shutdown")
             self.is_active = False
+            
+            # Let the writer drain everything queued so far, then close the file
+            self._queue.put(None)
+            self._writer_thread.join(timeout=2.0)
+            with self._lock:
+                self._close_log_handle()
     
     def get_current_log_file(self) -> Optional[str]:
         """Get path to current log file"""
         return str(self.log_file) if self.log_file else None
     
     def get_log_files(self) -> list:
-        """Get list of all log files for this client"""
-        if not self.log_dir.exists():
+        """
+        Get list of all log files for this client.
+        The directory scan is cached until the log directory changes
+        (file created, rotated or deleted).
+        """
+        if not self.log_dir or not self.log_dir.exists():
             return []
         
-        pattern = f"{self.client_id}_*.log"
-        log_files = []
+        dir_mtime = self.log_dir.stat().st_mtime_ns
+        if self._log_files_cache is None or dir_mtime != self._log_files_cache_mtime:
+            pattern = f"{self.client_id}_*.log"
+            log_files = []
+            
+            for log_file in self.log_dir.glob(pattern):
+                stats = log_file.stat()
+                log_files.append({
+                    'name': log_file.name,
+                    'path': str(log_file),
+                    'size_mb': stats.st_size / (1024 * 1024),
+                    'mtime': stats.st_mtime,
+                })
+            
+            log_files.sort(key=lambda x: x['mtime'], reverse=True)
+            for entry in log_files:
+                entry['modified'] = datetime.fromtimestamp(entry.pop('mtime')).strftime('%Y-%m-%d %H:%M:%S')
+            
+            self._log_files_cache = log_files
+            self._log_files_cache_mtime = dir_mtime
+        
+        result = [dict(entry) for entry in self._log_files_cache]
         
-        for log_file in self.log_dir.glob(pattern):
-            stats = log_file.stat()
-            log_files.append({
-                'name': log_file.name,
-                'path': str(log_file),
-                'size_mb': stats.st_size / (1024 * 1024),
-                'modified': datetime.fromtimestamp(stats.st_mtime).strftime('%Y-%m-%d %H:%M:%S')
-            })
+        # The active file keeps growing without touching the dir mtime, refresh just that one
+        current = str(self.log_file) if self.log_file else None
+        for entry in result:
+            if entry['path'] == current:
+                try:
+                    entry['size_mb'] = self.log_file.stat().st_size / (1024 * 1024)
+                except OSError:
+                    pass
+                break
         
-        return sorted(log_files, key=lambda x: x['modified'], reverse=True)
+        return result
 
 # Global logger instance
 _logger = ConsoleFileLogger()
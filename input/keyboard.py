@@ -2,14 +2,12 @@
 Enhanced cross-platform keyboard input handling for audio player controls.
 """
 
+import os
 import time
 import sys
 import atexit
 from colorama import init, Fore, Style
 
-# Initialize colorama for Windows ANSI support
-init(autoreset=True)
-
 # Cross-platform keyboard input handling
 try:
     import msvcrt  # Windows
@@ -22,6 +20,11 @@ except ImportError:
     WINDOWS = False
     UNIX = True
 
+# Initialize colorama for Windows ANSI support.
+# Unix terminals handle ANSI natively, so skip the stdout wrapper there.
+if WINDOWS:
+    init(autoreset=True)
+
 
 class KeyboardHandler:
     """Enhanced keyboard handler with proper terminal management"""
@@ -29,6 +32,7 @@ class KeyboardHandler:
     def __init__(self):
         self.old_terminal_settings = None
         self.terminal_configured = False
+        self._stdin_fd = None  # Raw stdin fd, read directly with os.read
         
         # Register cleanup on exit
         atexit.register(self.cleanup)
@@ -37,6 +41,8 @@ class KeyboardHandler:
         """Setup terminal for non-blocking input"""
         if UNIX and not self.terminal_configured:
             try:
+                self._stdin_fd = sys.stdin.fileno()
+                
                 # Save current terminal settings
                 self.old_terminal_settings = termios.tcgetattr(sys.stdin)
                 
@@ -63,9 +69,20 @@ class KeyboardHandler:
             except Exception:
                 pass
                 
-    def get_keypress(self):
-        """Enhanced cross-platform non-blocking keyboard input"""
+    def get_keypress(self, timeout=0.01):
+        """
+        Enhanced cross-platform keyboard input.
+        Waits up to `timeout` seconds for a key so callers don't need to poll.
+        """
         if WINDOWS:
+            if not msvcrt.kbhit():
+                # kbhit can't block, so wait in short steps
+                deadline = time.time() + timeout
+                while not msvcrt.kbhit():
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        return None
+                    time.sleep(min(remaining, 0.05))
             if msvcrt.kbhit():
                 key = msvcrt.getch()
                 # Handle special keys
@@ -78,16 +95,16 @@ class KeyboardHandler:
                     return None
         else:
             # Unix/Linux/macOS
-            if select.select([sys.stdin], [], [], 0.01) == ([sys.stdin], [], []):
+            fd = self._stdin_fd if self._stdin_fd is not None else sys.stdin.fileno()
+            if select.select([fd], [], [], timeout)[0]:
                 try:
-                    char = sys.stdin.read(1)
+                    # Read the raw byte, bypassing the TextIOWrapper layer
+                    char = os.read(fd, 1).decode('latin-1')
                     # Handle escape sequences (arrow keys, etc.)
                     if char == '\x1b':  # ESC sequence
-                        # Read the next characters to handle arrow keys
-                        if select.select([sys.stdin], [], [], 0.01) == ([sys.stdin], [], []):
-                            char += sys.stdin.read(1)
-                            if select.select([sys.stdin], [], [], 0.01) == ([sys.stdin], [], []):
-                                char += sys.stdin.read(1)
+                        # Drain the rest of the sequence (arrow keys etc.) in one read
+                        if select.select([fd], [], [], 0.01)[0]:
+                            os.read(fd, 8)
                         return None  # Ignore escape sequences for now
                     return char.lower()
                 except Exception:
@@ -95,15 +112,19 @@ class KeyboardHandler:
         return None
 
 
+# Pre-formatted feedback messages
+_VOLUME_MSG = f"\r{Fore.GREEN}Volume: {{pct}}%{Style.RESET_ALL}"
+_QUIT_MSG = f"\r{Fore.YELLOW}Quitting...{Style.RESET_ALL}"
+
+
 def clear_line():
     """Clear the current line for clean output"""
-    print("\r\033[K", end="")
+    sys.stdout.write("\r\033[K")
 
 
 def print_status_line(status_text):
-    """Print status line with proper clearing"""
-    clear_line()
-    print(f"\r{status_text}", end="")
+    """Print status line with proper clearing (single write + flush)"""
+    sys.stdout.write("\r\033[K" + status_text)
     sys.stdout.flush()
 
 
@@ -117,46 +138,56 @@ def input_handler(player, stop_event):
         # Print initial status
         print_status_line(player.get_status_line())
         
+        def volume_up():
+            player.volume_up()
+            print(_VOLUME_MSG.format(pct=player.get_volume_percentage()))
+        
+        def volume_down():
+            player.volume_down()
+            print(_VOLUME_MSG.format(pct=player.get_volume_percentage()))
+        
+        # Key -> action ("q" is handled separately since it ends the loop)
+        key_actions = {
+            "s": player.start_stop_toggle,
+            "p": player.play_pause_toggle,
+            "l": player.toggle_loop,
+            "+": volume_up,  # + key (with or without shift)
+            "=": volume_up,
+            "-": volume_down,  # - key (with or without shift)
+            "_": volume_down,
+        }
+        
+        status_interval = 0.5
         last_status_update = time.time()
         
         while not stop_event.is_set():
-            key = keyboard.get_keypress()
+            # Block until a key arrives or the next status update is due
+            timeout = max(0.0, last_status_update + status_interval - time.time())
+            key = keyboard.get_keypress(timeout)
             
             if key:
                 # Clear the current line before processing command
                 clear_line()
                 
                 if key == "q":
-                    print(f"\r{Fore.YELLOW}Quitting...{Style.RESET_ALL}")
+                    print(_QUIT_MSG)
                     stop_event.set()
                     break
-                elif key == "s":
-                    player.start_stop_toggle()
-                elif key == "p":
-                    player.play_pause_toggle()
-                elif key == "l":
-                    player.toggle_loop()
-                elif key in ["+", "="]:  # + key (with or without shift)
-                    player.volume_up()
-                    print(f"\r{Fore.GREEN}Volume: {player.get_volume_percentage()}%{Style.RESET_ALL}")
-                elif key in ["-", "_"]:  # - key (with or without shift)
-                    player.volume_down()
-                    print(f"\r{Fore.GREEN}Volume: {player.get_volume_percentage()}%{Style.RESET_ALL}")
-                else:
-                    # Unknown key - just refresh status
-                    pass
+                
+                # Unknown keys just refresh status
+                action = key_actions.get(key)
+                if action:
+                    action()
     
                 # Brief pause to show command feedback
                 time.sleep(0.1)
             
             # Update status line periodically (every 0.5 seconds)
             current_time = time.time()
-            if current_time - last_status_update > 0.5:
+            if current_time - last_status_update >= status_interval:
                 print_status_line(player.get_status_line())
                 last_status_update = current_time
             
-            time.sleep(0.05)  # Small delay to prevent excessive CPU usage
-            
     except KeyboardInterrupt:
         stop_event.set()
     finally:
@@ -27,23 +27,31 @@ ONGOING IMPLEMENTATIONS:
         - Implement repeat behavior via MQTT (only defined topic in shaker player config (currently) but a behavior implemented player class wise
 """
 
+import atexit
+import os
 import sys
+import signal
 import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait as wait_futures
 from colorama import Fore, Style
 import argparse
 
+# Watchdog status line, formatted once per report
+_WATCH_TMPL = (
+    "[WATCHDOG] Uptime:{u}m | MQTT:{m} | Threads:{a}/{n} | MsgRx:{r} | Audio:{h}"
+)
+
 # Import refactored modules
-from config.config_loader import load_config, get_player_settings, get_audio_paths
-from config.simple_logger import setup_logging, cleanup_logging, enable_auto_logging
-from player.utils import (
-    find_audio_files,
-    list_available_devices,
-    confirm_selected_device,
+# NOTE: player.* and mqtt.* are imported where they're used, so that e.g. `--help`
+# doesn't pay for loading numpy/scipy/PortAudio/paho.
+from config.config_loader import (
+    PlayerSettings,
+    load_config,
+    get_player_settings,
+    get_audio_paths,
 )
-from player.core import AudioPlayer
-from player.file_manager import AudioFileManager
-from mqtt.client import MQTTAudioClient
+from config.simple_logger import setup_logging, cleanup_logging, enable_auto_logging
 from input.keyboard import input_handler, print_controls_help
 
 
@@ -59,21 +67,58 @@ def parse_arguments():
     return parser.parse_args()
 
 
+def _apply_thread_scheduling(avoid_core0=False, niceness=0):
+    """
+    Adjust CPU affinity / priority of the calling thread so background work
+    competes less with the audio callback. Only on Linux, where both calls
+    apply per thread; elsewhere (and on failure) this is a no-op.
+    """
+    if not sys.platform.startswith("linux"):
+        return
+
+    try:
+        if avoid_core0:
+            cores = os.sched_getaffinity(0) - {0}
+            if cores:
+                os.sched_setaffinity(0, cores)
+        if niceness:
+            os.nice(niceness)
+    except OSError as e:
+        print(f"{Fore.YELLOW}[THREADS] Could not adjust thread scheduling: {e}{Style.RESET_ALL}")
+
+
 class AudioPlayerApp:
     """Main application class that orchestrates all components"""
 
+    # Long-lived singleton: slot storage instead of a per-instance dict.
+    # Any new instance attribute must be declared here.
+    __slots__ = (
+        "player",
+        "mqtt_client",
+        "file_manager",
+        "stop_event",
+        "_futures",
+        "config",
+        "player_settings",
+        "paths",
+    )
+
     def __init__(self):
         self.player = None
         self.mqtt_client = None
         self.file_manager = None
         self.stop_event = threading.Event()
-        self.threads = []
+        # One Future per background (daemon) worker thread; exposes liveness and crashes
+        self._futures = []
 
         # Configuration
         self.config = None
         self.player_settings = None
         self.paths = None
 
+        # Flush/close the log file even if we exit without going through shutdown()
+        atexit.register(self._atexit_cleanup)
+
     def load_configuration(self, config_file=None):
         """Load and process configuration"""
         try:
@@ -94,7 +139,7 @@ class AudioPlayerApp:
             setup_logging(client_id, log_dir, logging_config.get("max_size_mb", 1))
             enable_auto_logging()  # ** This makes ALL print statements also go to log file
 
-            self.player_settings = get_player_settings(player_config)
+            self.player_settings = PlayerSettings(**get_player_settings(player_config))
             self.paths = get_audio_paths(paths_config)
 
             print(f"{Fore.GREEN}Configuration loaded successfully{Style.RESET_ALL}")
@@ -106,27 +151,39 @@ class AudioPlayerApp:
 
     def setup_audio_system(self):
         """Setup audio devices and find audio files"""
-        # Find audio files
-        wav_files, audio_file_exists, full_audio_dir = find_audio_files(
-            self.paths["audio_dir"]
+        from player.utils import (
+            find_audio_files,
+            list_available_devices,
+            confirm_selected_device,
+            get_devices,
         )
-        if not audio_file_exists:
-            return False, None, None
 
-        # List and validate audio devices
-        list_available_devices()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            # Enumerate audio devices in the background while scanning the disk.
+            # Only the query runs concurrently; printing stays in order below.
+            devices_future = executor.submit(get_devices)
+
+            # Find audio files
+            wav_files, audio_file_exists, full_audio_dir = find_audio_files(
+                self.paths["audio_dir"]
+            )
+            if not audio_file_exists:
+                return False, None, None
+
+            # List and validate audio devices
+            list_available_devices(devices_future.result())
 
         device_info, device_index, target_channels, channel_mapping = (
             confirm_selected_device(
-                device=self.player_settings["device_name"],
-                target_channels=self.player_settings["channels"],
-                channel_mapping=self.player_settings["channel_mask"],
+                device=self.player_settings.device_name,
+                target_channels=self.player_settings.channels,
+                channel_mapping=self.player_settings.channel_mask,
             )
         )
 
         # Update player settings if device capabilities are different
-        self.player_settings["channels"] = target_channels
-        self.player_settings["channel_mask"] = channel_mapping
+        self.player_settings.channels = target_channels
+        self.player_settings.channel_mask = channel_mapping
 
         print(
             f"\n{Fore.LIGHTMAGENTA_EX}Selected device:{Style.RESET_ALL}\n"
@@ -138,22 +195,29 @@ class AudioPlayerApp:
 
     def create_components(self, wav_files, audio_dir):
         """Create and configure all application components"""
+        from player.core import AudioPlayer
+        from player.file_manager import AudioFileManager
+        from mqtt.client import MQTTAudioClient
+
         # Create audio player
         self.player = AudioPlayer(
-            device=self.player_settings["device_name"],
-            volume_factor=self.player_settings["volume"],
-            target_sample_rate=self.player_settings["sample_rate"],
-            target_channels=self.player_settings["channels"],
-            channel_mapping=self.player_settings["channel_mask"],
-            audio_level_enabled=self.player_settings["audio_level_enabled"],
+            device=self.player_settings.device_name,
+            volume_factor=self.player_settings.volume,
+            target_sample_rate=self.player_settings.sample_rate,
+            target_channels=self.player_settings.channels,
+            channel_mapping=self.player_settings.channel_mask,
+            audio_level_enabled=self.player_settings.audio_level_enabled,
+            blocksize=self.player_settings.stream_blocksize,
+            latency=self.player_settings.stream_latency,
+            resample_cache_max_mb=self.player_settings.resample_cache_max_mb,
         )
 
         # Configure auto-start
-        self.player.set_auto_start(self.player_settings["auto_start"])
+        self.player.set_auto_start(self.player_settings.auto_start)
 
         # Create file manager
         self.file_manager = AudioFileManager(
-            audio_dir=audio_dir, auto_start_enabled=self.player_settings["auto_start"]
+            audio_dir=audio_dir, auto_start_enabled=self.player_settings.auto_start
         )
 
         # Load initial audio file
@@ -185,42 +249,63 @@ class AudioPlayerApp:
         """Start all background threads"""
         # TBT
         # # Input handler thread
-        # input_thread = threading.Thread(
-        #     target=input_handler, args=(self.player, self.stop_event)
-        # )
-        # input_thread.daemon = True
-        # input_thread.start()
-        # self.threads.append(input_thread)
+        # self._start_worker(input_handler, (self.player, self.stop_event))
         print(
             f"{Fore.YELLOW}[TEST] Keyboard input DISABLED - use Ctrl+C to quit{Style.RESET_ALL}"
         )
         # --
 
-        # MQTT client thread
-        mqtt_thread = threading.Thread(
-            target=self.mqtt_client.connect_and_run, args=(self.stop_event,)
+        # MQTT client thread (kept off core 0, which PortAudio's callback tends to use)
+        self._start_worker(
+            self.mqtt_client.connect_and_run, (self.stop_event,), avoid_core0=True
         )
-        mqtt_thread.daemon = True
-        mqtt_thread.start()
-        self.threads.append(mqtt_thread)
 
         # NEW - MQTT Health monitoring thread
-        # Watchdog thread
-        watchdog_thread = threading.Thread(
-            target=self._watchdog_monitor, args=(self.stop_event,)
+        # Watchdog thread (low priority, it only reports)
+        self._start_worker(
+            self._watchdog_monitor, (self.stop_event,), avoid_core0=True, niceness=10
         )
-        watchdog_thread.daemon = True
-        watchdog_thread.start()
-        self.threads.append(watchdog_thread)
         # ---
 
         print(f"{Fore.GREEN}All background threads started{Style.RESET_ALL}")
 
+    def _start_worker(self, target, args, avoid_core0=False, niceness=0):
+        """
+        Run target(*args) on its own daemon thread and keep a Future that
+        records how it ended. Daemon threads can't hold up interpreter exit
+        when a worker is stuck in a blocking call (connect, keyboard read).
+        Args:
+            avoid_core0: Pin the worker to all CPUs except core 0 (Linux only)
+            niceness: Lower the worker's scheduling priority by this much (Linux only)
+        """
+        future = Future()
+        thread = threading.Thread(
+            target=self._run_worker,
+            args=(future, target, args, avoid_core0, niceness),
+            name=f"apa-{getattr(target, '__name__', 'worker')}",
+            daemon=True,
+        )
+        self._futures.append(future)
+        thread.start()
+        return future
+
+    @staticmethod
+    def _run_worker(future, target, args, avoid_core0=False, niceness=0):
+        """Worker body: apply scheduling tweaks, run target, record the outcome"""
+        future.set_running_or_notify_cancel()
+        _apply_thread_scheduling(avoid_core0, niceness)
+        try:
+            result = target(*args)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+
     def print_startup_info(self):
         """Print application startup information"""
         client_id = self.config["mqtt"]["client_id"]
         auto_start_status = (
-            "ENABLED" if self.player_settings["auto_start"] else "DISABLED"
+            "ENABLED" if self.player_settings.auto_start else "DISABLED"
         )
 
         print(
@@ -269,10 +354,17 @@ class AudioPlayerApp:
         # Start background threads
         self.start_threads()
 
+        # Service managers (systemd etc.) stop us with SIGTERM: shut down cleanly
+        signal.signal(signal.SIGTERM, self._handle_termination_signal)
+
+        # Block until shutdown is requested. On Windows Ctrl+C isn't delivered
+        # while blocked in Event.wait(), so wake up periodically there.
+        wait_timeout = 1.0 if sys.platform == "win32" else None
+
         try:
             # Main event loop
-            while not self.stop_event.is_set():
-                time.sleep(0.1)
+            while not self.stop_event.wait(wait_timeout):
+                pass
 
         except KeyboardInterrupt:
             print(f"\n{Fore.YELLOW}Received interrupt signal{Style.RESET_ALL}")
@@ -282,6 +374,15 @@ class AudioPlayerApp:
         self.shutdown()
         return 0
 
+    def _atexit_cleanup(self):
+        """Interpreter exit hook (cleanup_logging is a no-op if already done)"""
+        cleanup_logging()
+
+    def _handle_termination_signal(self, signum, frame):
+        """Signal handler: request a clean shutdown"""
+        print(f"\n{Fore.YELLOW}Received signal {signum}{Style.RESET_ALL}")
+        self.stop_event.set()
+
     def shutdown(self):
         """Clean shutdown procedure"""
         print(f"\n{Fore.YELLOW}Shutting down...{Style.RESET_ALL}")
@@ -290,9 +391,9 @@ class AudioPlayerApp:
         if self.player:
             self.player.stop_stream()
 
-        # Wait for threads to finish
-        for thread in self.threads:
-            thread.join(timeout=1.0)
+        # Wait for workers to finish (they exit on stop_event)
+        self.stop_event.set()
+        wait_futures(self._futures, timeout=1.0)
 
         cleanup_logging()
 
@@ -301,30 +402,51 @@ class AudioPlayerApp:
     # NEW - Watchdog monitor for MQTT health
     def _watchdog_monitor(self, stop_event):
         """Monitor system health and detect issues"""
-        start_time = time.time()
-        watchdog_interval = 30  # seconds
+        # Monotonic clock so uptime isn't affected by NTP/wall-clock jumps
+        start_ns = time.monotonic_ns()
+        healthy_interval = 30  # seconds
+        degraded_interval = 5  # seconds, report more often while MQTT is down
+        watchdog_interval = healthy_interval
+        # An unchanged all-OK status is only re-printed this often
+        quiet_heartbeat_ns = 300 * 1_000_000_000
+        last_signature = None
+        last_print_ns = 0
 
         while not stop_event.is_set():
             try:
-                time.sleep(watchdog_interval)
+                # Returns early (True) as soon as shutdown is requested
+                if stop_event.wait(watchdog_interval):
+                    break
 
                 # Calculate uptime
-                uptime_minutes = int(time.time() - start_time) // 60
+                uptime_minutes = (time.monotonic_ns() - start_ns) // 60_000_000_000
 
                 # Safety check: ensure mqtt_client exists
-                if not self.mqtt_client:
+                if self.mqtt_client is None:
                     print(f"{Fore.RED}[WATCHDOG] MQTT client not initialized!{Style.RESET_ALL}")
                     continue
 
                 # Get health statuses
                 mqtt_health = self.mqtt_client.get_health_status()
-                active_threads = len([t for t in self.threads if t.is_alive()])
-                threads_ok = (active_threads == len(self.threads))
+                mqtt_connected = mqtt_health['connected']
+                messages_rx = mqtt_health['messages_rx']
+                watchdog_interval = (
+                    healthy_interval if mqtt_connected else degraded_interval
+                )
+                active_threads = sum(1 for f in self._futures if not f.done())
+                threads_ok = (active_threads == len(self._futures))
+
+                # A finished worker crashed or returned early; its future says why
+                worker_errors = [
+                    repr(f.exception())
+                    for f in self._futures
+                    if f.done() and f.exception() is not None
+                ]
 
                 # Audio playback health check
                 audio_health = "OK"
                 audio_issues = []
-                if hasattr(self, 'player') and self.player:
+                if self.player is not None:
                     try:
                         health_status = self.player.check_playback_health()
                         if isinstance(health_status, dict) and not health_status.get('is_healthy', True):
@@ -334,27 +456,46 @@ class AudioPlayerApp:
                         audio_health = "ERROR"
                         audio_issues = [str(e)]
 
+                # Skip repeating an identical healthy line (still alert on anything non-OK)
+                all_ok = mqtt_connected and threads_ok and audio_health == "OK"
+                signature = (mqtt_connected, threads_ok, audio_health, messages_rx // 100)
+                now_ns = time.monotonic_ns()
+                if (
+                    all_ok
+                    and signature == last_signature
+                    and now_ns - last_print_ns < quiet_heartbeat_ns
+                ):
+                    continue
+                last_signature = signature
+                last_print_ns = now_ns
+
                 # Build status string
-                status = (
-                    f"[WATCHDOG] Uptime:{uptime_minutes}m | "
-                    f"MQTT:{'OK' if mqtt_health['connected'] else 'DOWN'} | "
-                    f"Threads:{active_threads}/{len(self.threads)} | "
-                    f"MsgRx:{mqtt_health['messages_rx']} | "
-                    f"Audio:{audio_health}"
+                status = _WATCH_TMPL.format(
+                    u=uptime_minutes,
+                    m="OK" if mqtt_connected else "DOWN",
+                    a=active_threads,
+                    n=len(self._futures),
+                    r=messages_rx,
+                    h=audio_health,
                 )
 
                 if audio_issues:
                     status += f" ({', '.join(audio_issues)})"
+                if worker_errors:
+                    status += f" [worker error: {'; '.join(worker_errors)}]"
 
-                # Color based on health
-                if mqtt_health['connected'] and threads_ok and audio_health == "OK":
-                    print(f"{Fore.GREEN}{status}{Style.RESET_ALL}")
+                # Color based on health (picked first, then printed once)
+                if all_ok:
+                    color, alert = Fore.GREEN, ""
                 elif audio_health in ["STALLED", "ERROR"]:
-                    print(f"{Fore.RED}{status} ⚠ AUDIO CALLBACK ISSUE!{Style.RESET_ALL}")
-                elif not mqtt_health['connected']:
-                    print(f"{Fore.RED}{status} ⚠ MQTT DOWN!{Style.RESET_ALL}")
+                    color, alert = Fore.RED, " ⚠ AUDIO CALLBACK ISSUE!"
+                elif not mqtt_connected:
+                    color, alert = Fore.RED, " ⚠ MQTT DOWN!"
                 else:
-                    print(f"{Fore.YELLOW}{status}{Style.RESET_ALL}")
+                    color, alert = Fore.YELLOW, ""
+
+                # Single print so the line is still mirrored to the log file
+                print(color + status + alert + Style.RESET_ALL)
 
             except Exception as e:
                 print(f"{Fore.RED}[WATCHDOG] Error: {e}{Style.RESET_ALL}")
@@ -368,6 +509,10 @@ def main():
 
     app = AudioPlayerApp()
 
+    # Until run() installs its graceful handler, turn SIGTERM into a normal
+    # exit so atexit hooks (log flush) still run
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+
     try:
         # Pass config file argument to load_configuration
         return app.run(config_file=args.config)
@@ -379,6 +524,9 @@ def main():
     except Exception as e:
         print(f"{Fore.RED}Unexpected error: {e}{Style.RESET_ALL}")
         return 1
+    finally:
+        # Tell workers to stop on every exit path (e.g. an error before shutdown())
+        app.stop_event.set()
 
 
 if __name__ == "__main__":
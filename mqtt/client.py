@@ -3,12 +3,62 @@ MQTT client for audio player with command handling and state publishing.
 """
 
 import os
+import re
+import heapq
 import json
+import queue
+import socket
+import struct
 import time
 import threading
 import paho.mqtt.client as mqtt
 from colorama import Fore, Style
 
+from player.core import PlayerState
+from config.config_loader import _parse_boolean_config
+
+# Publish payloads are serialized straight to bytes (paho sends bytes as-is).
+# orjson is optional and much faster; fall back to the stdlib if it's missing.
+try:
+    import orjson
+
+    _dumps = orjson.dumps
+except ImportError:
+
+    def _dumps(obj):
+        return json.dumps(obj).encode("utf-8")
+
+
+# Enum members compared by identity on the command paths
+_PLAYING = PlayerState.PLAYING
+_STOPPED = PlayerState.STOPPED
+
+# Set MQTT_DEBUG=1 to trace every inbound message
+DEBUG = bool(int(os.environ.get("MQTT_DEBUG", "0")))
+
+# Binary audio level payload: little-endian uint32 sequence number + float32 level (8 bytes)
+_LEVEL_PACK = struct.Struct("<If").pack
+
+# Seek payloads: "MM:SS", "NN.N%" or plain seconds
+_SEEK_RE = re.compile(r"^(?:(\d+):(\d+)|(\d*\.?\d+)%|(\d*\.?\d+))$")
+
+# Command payload words
+_LOOP_TRUE = frozenset(("true", "1", "yes", "on", "enable"))
+_PLAY_WORDS = frozenset(("play", "start"))
+
+# Max publishes waiting for the publish worker before new periodic ones are dropped
+_PUBLISH_QUEUE_SIZE = 256
+
+# How long a one-off publish waits for room in a full queue (seconds)
+_PUBLISH_PUT_TIMEOUT = 2.0
+
+# Position ticks an unchanged payload may be skipped for (8 ticks = 1 s)
+_POSITION_REPEAT_TICKS = 8
+
+# Repeat command limits
+MAX_REPEAT_COUNT = 10
+MAX_REPEAT_INTERVAL = 30.0
+
 
 class DownloadState:
     DOWNLOADING = "downloading"
@@ -23,13 +73,20 @@ class MQTTAudioClient:
         self.player = player
         self.file_manager = file_manager
         self.client = None
-        self.health_thread = None
-        self.position_thread = None
-        self.level_thread = None
+        self.scheduler_thread = None  # Runs the health/position/level publishers
+        self._last_position_payload = None  # Last published position dict
+        self._position_ticks_since_emit = 0
+        self._last_position_retain = 0.0  # monotonic time of last retained position
+        self._level_seq = 0  # Sequence number for binary level payloads
+        self._handlers = {}  # topic -> handler, built on connect
+        # All publishes from this module go through one worker thread
+        self._publish_q = queue.Queue(maxsize=_PUBLISH_QUEUE_SIZE)
+        self._publish_thread = None
         # NEW
         # Health monitoring counters
         self.messages_received = 0
         self.messages_sent = 0
+        self.publishes_dropped = 0
         self.last_message_time = time.time()
 
 
@@ -74,22 +131,68 @@ class MQTTAudioClient:
         # Start background loop
         self.client.loop_start()
 
-        # Wait for stop signal
-        while not stop_event.is_set():
-            time.sleep(0.1)
+        # Start the publish worker
+        self._publish_thread = threading.Thread(target=self._publish_worker)
+        self._publish_thread.daemon = True
+        self._publish_thread.start()
+
+        # Block until the stop signal (no polling)
+        stop_event.wait()
 
         # Clean shutdown
         self._shutdown()
 
+    def _enqueue_publish(self, topic, payload, qos=0, retain=False, drop_ok=True):
+        """
+        Hand a publish to the worker thread.
+        drop_ok: Periodic scheduler data, dropped if the queue is full (the next
+                 tick carries fresher values). One-off messages pass False and
+                 wait for room instead.
+        """
+        item = (topic, payload, qos, retain)
+        try:
+            if drop_ok:
+                self._publish_q.put_nowait(item)
+            else:
+                self._publish_q.put(item, timeout=_PUBLISH_PUT_TIMEOUT)
+        except queue.Full:
+            self.publishes_dropped += 1
+            if not drop_ok:
+                print(
+                    f"\r[MQTT] {Fore.LIGHTRED_EX}Publish queue full, dropped message for:{Style.RESET_ALL} {topic}"
+                )
+
+    def _publish_worker(self):
+        """Drain the publish queue into paho until the None sentinel arrives"""
+        publish = self.client.publish
+        get = self._publish_q.get
+        while True:
+            item = get()
+            if item is None:
+                break
+            topic, payload, qos, retain = item
+            try:
+                publish(topic, payload, qos=qos, retain=retain)
+                self.messages_sent += 1
+            except Exception as e:
+                print(f"\r[MQTT] {Fore.LIGHTRED_EX}Publish error: {e}{Style.RESET_ALL}")
+
     def _shutdown(self):
         """Clean shutdown procedure"""
+        # Flush queued publishes before the offline message
+        if self._publish_thread is not None:
+            try:
+                self._publish_q.put(None, timeout=1.0)
+            except queue.Full:
+                pass
+            self._publish_thread.join(timeout=1.0)
+
         try:
             health_topic = self.config["pub"]["topics"]["player_health"]
-            offline_payload = {
-                "status": "offline",
-                "client_id": self.config["client_id"],
-            }
-            self.client.publish(health_topic, json.dumps(offline_payload))
+            offline_payload = _dumps(
+                {"status": "offline", "client_id": self.config["client_id"]}
+            )
+            self.client.publish(health_topic, offline_payload)
             time.sleep(0.5)
             print(
                 f"\r[MQTT] {Fore.LIGHTMAGENTA_EX}Offline status sent{Style.RESET_ALL}"
@@ -131,12 +234,39 @@ class MQTTAudioClient:
                 f"\r[MQTT] {Fore.LIGHTGREEN_EX}Connected{Style.RESET_ALL} to "
                 f"mqtt://{self.config['broker']}:{self.config['port']}"
             )
+            # Small JSON publishes shouldn't wait on Nagle's algorithm.
+            # Reconnects open a new socket, so this runs on every connect.
+            try:
+                sock = client.socket()
+                if sock is not None:
+                    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            except (OSError, AttributeError):
+                pass
+
             print(
                 f"\r[MQTT] {Fore.LIGHTBLUE_EX}Subscribing to topics:{Style.RESET_ALL}"
             )
 
             # Subscribe to topics
             sub_topics = self.config["sub"]["topics"]
+
+            # Route table for _on_message (topic string -> handler)
+            handler_by_name = {
+                "file_topic": self._handle_file_download,
+                "play_pause_cmd_topic": self._handle_play_pause_command,
+                "start_stop_cmd_topic": self._handle_start_stop_command,
+                "loop_toggle_cmd_topic": self._handle_loop_command,
+                "volume_cmd_topic": self._handle_volume_command,
+                "seek_cmd_topic": self._handle_seek_command,
+                "status_check": self._handle_status_request,
+                "channel_mask_cmd_topic": self._handle_channel_mask_command,
+                "repeat_cmd_topic": self._handle_repeat_command,
+            }
+            self._handlers = {
+                sub_topics[name]: handler
+                for name, handler in handler_by_name.items()
+                if name in sub_topics
+            }
             for topic_name, topic_value in sub_topics.items():
                 client.subscribe(topic_value)
                 print(
@@ -145,155 +275,252 @@ class MQTTAudioClient:
 
             print(f"\r[MQTT] {Fore.LIGHTGREEN_EX}Setup complete{Style.RESET_ALL}")
 
-            # Start health monitoring
-            self._start_health_monitoring(client, stop_event)
-
-            # Start position monitoring
-            self._start_position_monitoring(client, stop_event)
-
-            # Start level monitoring
-            self._start_level_monitoring(client, stop_event)
+            # Start health, position and level publishing
+            self._start_publishers(stop_event)
             
             # Initialize state tracking and publish initial state
             self.player._last_published_state = None  # Force Publish
             self.player.publish_player_state()
             print(f"\r[MQTT] {Fore.LIGHTGREEN_EX}Initial state published{Style.RESET_ALL}")
 
-    def _start_health_monitoring(self, client, stop_event):
-        """Start health publisher thread"""
-        heartbeat_enabled = self.config.get("heartbeat", False)
-        if isinstance(heartbeat_enabled, str):
-            heartbeat_enabled = heartbeat_enabled.upper() in ["TRUE", "1", "YES", "ON"]
+    def _start_publishers(self, stop_event):
+        """Start the publisher scheduler thread (health, position, level)"""
+        if self.scheduler_thread is not None and self.scheduler_thread.is_alive():
+            return
 
-        if heartbeat_enabled:
-            if self.health_thread is None or not self.health_thread.is_alive():
-                self.health_thread = threading.Thread(
-                    target=self._health_publisher, args=(client, stop_event)
+        pub_topics = self.config["pub"]["topics"]
+        level_enabled = getattr(self.player, "audio_level_enabled", False)
+
+        # Per-topic position/level publishing; can be switched off once
+        # consumers read the combined audio_telemetry topic instead
+        legacy_topics = _parse_boolean_config(self.config.get("legacy_audio_topics", True))
+        telemetry_topic = pub_topics.get("audio_telemetry")
+
+        # Jobs: (interval seconds, emit function, args, only while playing)
+        jobs = []
+        if legacy_topics:
+            jobs.append(
+                (0.125, self._emit_position, (self._enqueue_publish, pub_topics["audio_position"]), True)
+            )
+        if telemetry_topic:
+            jobs.append(
+                (
+                    0.125,
+                    self._emit_telemetry,
+                    (self._enqueue_publish, telemetry_topic, level_enabled),
+                    True,
                 )
-                self.health_thread.daemon = True
-                self.health_thread.start()
-                print(
-                    f"\r[MQTT] {Fore.LIGHTMAGENTA_EX}Health monitoring started{Style.RESET_ALL}"
+            )
+            print(
+                f"\r[MQTT] {Fore.LIGHTCYAN_EX}Telemetry publisher started{Style.RESET_ALL}"
+            )
+
+        heartbeat_enabled = _parse_boolean_config(self.config.get("heartbeat", False))
+
+        if heartbeat_enabled:
+            # The heartbeat never changes: serialize it once
+            online_payload = _dumps(
+                {"status": "online", "client_id": self.config["client_id"]}
+            )
+            jobs.append(
+                (
+                    self.config["heartbeat_freq"],
+                    self._emit_health,
+                    (self._enqueue_publish, pub_topics["player_health"], online_payload),
+                    False,
                 )
+            )
+            print(
+                f"\r[MQTT] {Fore.LIGHTMAGENTA_EX}Health monitoring started{Style.RESET_ALL}"
+            )
         else:
             print(
                 f"\r[MQTT] {Fore.LIGHTMAGENTA_EX}Health monitoring disabled in config{Style.RESET_ALL}"
             )
 
-    def _start_position_monitoring(self, client, stop_event):
-        """Start position publisher thread"""
-        if self.position_thread is None or not self.position_thread.is_alive():
-            self.position_thread = threading.Thread(
-                target=self._position_publisher, args=(client, stop_event)
+        if not legacy_topics:
+            print(
+                f"\r[MQTT] {Fore.LIGHTMAGENTA_EX}Per-topic position/level publishing disabled in config{Style.RESET_ALL}"
             )
-            self.position_thread.daemon = True
-            self.position_thread.start()
+            level_enabled = False  # Level rides along in the telemetry payload
+        else:
             print(
                 f"\r[MQTT] {Fore.LIGHTCYAN_EX}Position publisher started{Style.RESET_ALL}"
             )
 
-    def _health_publisher(self, client, stop_event):
-        """Publish health status periodically"""
-        health_topic = self.config["pub"]["topics"]["player_health"]
-        heartbeat_freq = self.config["heartbeat_freq"]
-
-        while not stop_event.is_set():
-            try:
-                payload = {
-                    "status": "online",
-                    "client_id": self.config["client_id"],
-                }
-                client.publish(health_topic, json.dumps(payload))
-            except Exception as e:
-                print(
-                    f"\r[MQTT] {Fore.LIGHTRED_EX}Health publish error: {e}{Style.RESET_ALL}"
-                )
-
-            time.sleep(heartbeat_freq)
-
-    def _start_level_monitoring(self, client, stop_event):
-        """Start audio level publisher thread"""
         # Check if level monitoring is enabled
-        level_enabled = getattr(self.player, "audio_level_enabled", False)
-
         if level_enabled:
-            if self.level_thread is None or not self.level_thread.is_alive():
-                self.level_thread = threading.Thread(
-                    target=self._level_publisher, args=(client, stop_event)
-                )
-                self.level_thread.daemon = True
-                self.level_thread.start()
-                print(
-                    f"\r[MQTT] {Fore.LIGHTGREEN_EX}Level publisher started{Style.RESET_ALL}"
+            level_freq = self.config.get(
+                "audio_level_freq", 10
+            )  # Get from config, or else 10 Hz (1/10 sec)
+            # 'binary' packs the level with _LEVEL_PACK instead of JSON
+            level_binary = str(self.config.get("audio_level_format", "json")).lower() == "binary"
+            jobs.append(
+                (
+                    1.0 / level_freq,
+                    self._emit_level,
+                    (self._enqueue_publish, pub_topics["audio_level"], level_binary),
+                    True,
                 )
+            )
+            print(
+                f"\r[MQTT] {Fore.LIGHTGREEN_EX}Level publisher started{Style.RESET_ALL}"
+            )
         else:
             print(
                 f"\r[MQTT] {Fore.LIGHTMAGENTA_EX}Level publishing disabled in config{Style.RESET_ALL}"
             )
 
-    def _position_publisher(self, client, stop_event):
-        """Publish playhead position during playback"""
-        position_topic = self.config["pub"]["topics"]["audio_position"]
+        self.scheduler_thread = threading.Thread(
+            target=self._publish_scheduler, args=(jobs, stop_event)
+        )
+        self.scheduler_thread.daemon = True
+        self.scheduler_thread.start()
+
+    def _publish_scheduler(self, jobs, stop_event):
+        """
+        Run all periodic publishers from one thread, earliest deadline first.
+        Jobs flagged as playback-only are parked while nothing is playing
+        and resume as soon as playing_event is set.
+        """
+        playing_event = self.player.playing_event
+        now = time.monotonic()
+        # (next run, tie-breaker, interval, fn, args, only while playing)
+        heap = [
+            (now, seq, interval, fn, args, gated)
+            for seq, (interval, fn, args, gated) in enumerate(jobs)
+        ]
+        heapq.heapify(heap)
+        parked = []
 
         while not stop_event.is_set():
-            try:
+            if parked and playing_event.is_set():
+                now = time.monotonic()
+                for job in parked:
+                    heapq.heappush(heap, (now, *job))
+                parked.clear()
+
+            timeout = heap[0][0] - time.monotonic() if heap else 1.0
+            if timeout > 0:
+                # Parked jobs also need waking when playback starts
+                # (either way stop_event is re-checked at least once a second)
+                waiter = playing_event if parked else stop_event
+                waiter.wait(timeout=min(timeout, 1.0))
+                continue
+
+            deadline, seq, interval, fn, args, gated = heapq.heappop(heap)
+            if gated and not playing_event.is_set():
+                parked.append((seq, interval, fn, args, gated))
+                continue
+
+            fn(*args)
+
+            # Keep a fixed cadence, but don't burst to catch up after a stall
+            next_run = deadline + interval
+            now = time.monotonic()
+            if next_run < now:
+                next_run = now + interval
+            heapq.heappush(heap, (next_run, seq, interval, fn, args, gated))
+
+    def _emit_health(self, publish, health_topic, online_payload):
+        """Publish one health heartbeat"""
+        try:
+            publish(health_topic, online_payload)
+        except Exception as e:
+            print(
+                f"\r[MQTT] {Fore.LIGHTRED_EX}Health publish error: {e}{Style.RESET_ALL}"
+            )
+
+    def _emit_position(self, publish, position_topic):
+        """Publish the playhead position"""
+        # Locals instead of repeated attribute lookups (runs 8x per second)
+        player = self.player
+        file_manager = self.file_manager
+        try:
+            total_samples = player.audio_length
+            if total_samples > 0:
+                position_samples = player.position
+                percentage = (position_samples / total_samples) * 100
+                current_file = file_manager.current_file_basename if file_manager else None
+
+                position_data = {
+                    "position": player.get_time_string(position_samples),
+                    "total_duration": player.get_total_time_string(),
+                    "percentage": round(percentage, 1),
+                    "current_file": current_file,
+                }
+
+                # Skip ticks that would repeat the last payload, but still
+                # re-send it now and then to keep the retained message fresh
                 if (
-                    self.player.state.value == "playing"
-                    and self.player.audio_length > 0
+                    position_data == self._last_position_payload
+                    and self._position_ticks_since_emit < _POSITION_REPEAT_TICKS
                 ):
+                    self._position_ticks_since_emit += 1
+                    return
 
-                    position_samples = self.player.position
-                    total_samples = self.player.audio_length
-                    percentage = (
-                        (position_samples / total_samples) * 100
-                        if total_samples > 0
-                        else 0
-                    )
-
-                    position_data = {
-                        "position": self.player.get_time_string(position_samples),
-                        "total_duration": self.player.get_total_time_string(),
-                        "percentage": round(percentage, 1),
-                        "current_file": (
-                            os.path.basename(self.file_manager.current_file)
-                            if self.file_manager and self.file_manager.current_file
-                            else None
-                        ),
-                    }
+                # Only refresh the broker's retained copy once a second;
+                # the ticks in between go out as plain QoS 0 messages
+                now = time.monotonic()
+                retain = now - self._last_position_retain >= 1.0
+                if retain:
+                    self._last_position_retain = now
 
-                    client.publish(
-                        position_topic, json.dumps(position_data), retain=True
-                    )
+                publish(position_topic, _dumps(position_data), qos=0, retain=retain)
+                self._last_position_payload = position_data
+                self._position_ticks_since_emit = 0
 
-            except Exception as e:
-                print(
-                    f"\r[MQTT] {Fore.LIGHTRED_EX}Position publish error: {e}{Style.RESET_ALL}"
-                )
+        except Exception as e:
+            print(
+                f"\r[MQTT] {Fore.LIGHTRED_EX}Position publish error: {e}{Style.RESET_ALL}"
+            )
 
-            time.sleep(0.125)  # 8 times per second
+    def _emit_telemetry(self, publish, telemetry_topic, include_level):
+        """Publish position (and level) as one combined message"""
+        player = self.player
+        file_manager = self.file_manager
+        try:
+            total_samples = player.audio_length
+            if total_samples > 0:
+                position_samples = player.position
+                current_file = file_manager.current_file_basename if file_manager else None
+
+                telemetry = {
+                    "position": player.get_time_string(position_samples),
+                    "total_duration": player.get_total_time_string(),
+                    "percentage": round((position_samples / total_samples) * 100, 1),
+                    "current_file": current_file,
+                    "timestamp": time.time(),
+                }
+                if include_level:
+                    telemetry["level"] = round(player.normalized_audio_level, 4)
 
-    def _level_publisher(self, client, stop_event):
-        """Publish audio levels during playback"""
-        level_topic = self.config["pub"]["topics"]["audio_level"]
-        level_freq = self.config.get(
-            "audio_level_freq", 10
-        )  # Get from config, or else 10 Hz (1/10 sec)
+                publish(telemetry_topic, _dumps(telemetry))
 
-        while not stop_event.is_set():
-            try:
-                if self.player.state.value == "playing":
-                    level_data = {
-                        "level": round(self.player.normalized_audio_level, 4),
-                        "timestamp": time.time(),
-                    }
-                    client.publish(level_topic, json.dumps(level_data))
+        except Exception as e:
+            print(
+                f"\r[MQTT] {Fore.LIGHTRED_EX}Telemetry publish error: {e}{Style.RESET_ALL}"
+            )
 
-            except Exception as e:
-                print(
-                    f"\r[MQTT] {Fore.LIGHTRED_EX}Level publish error: {e}{Style.RESET_ALL}"
-                )
+    def _emit_level(self, publish, level_topic, binary=False):
+        """Publish the current audio level (JSON, or 8 packed bytes if binary)"""
+        try:
+            if binary:
+                # A wrapping counter instead of a wall-clock timestamp:
+                # subscribers can still spot gaps and ordering
+                self._level_seq = (self._level_seq + 1) & 0xFFFFFFFF
+                publish(level_topic, _LEVEL_PACK(self._level_seq, self.player.normalized_audio_level))
+                return
+            level_data = {
+                "level": round(self.player.normalized_audio_level, 4),
+                "timestamp": time.time(),
+            }
+            publish(level_topic, _dumps(level_data))
 
-            time.sleep(1.0 / level_freq)  # Use configurable frequency
+        except Exception as e:
+            print(
+                f"\r[MQTT] {Fore.LIGHTRED_EX}Level publish error: {e}{Style.RESET_ALL}"
+            )
 
     def _on_message(self, client, userdata, message):
         """Handle incoming MQTT messages"""
@@ -304,32 +531,20 @@ class MQTTAudioClient:
         self.last_message_time = time.time()
         # ----
         
-        payload = message.payload.decode().strip()
-        print(
-            f"\r[MQTT] -->> TOPIC: {Fore.LIGHTMAGENTA_EX}{topic}{Style.RESET_ALL} "
-            f"and PAYLOAD: {Fore.LIGHTCYAN_EX}{payload}{Style.RESET_ALL}"
-        )
+        # Handlers get raw bytes: JSON handlers parse them directly,
+        # text handlers decode just the (short) command themselves
+        payload = message.payload.strip()
+        if DEBUG:
+            print(
+                f"\r[MQTT] -->> TOPIC: {Fore.LIGHTMAGENTA_EX}{topic}{Style.RESET_ALL} "
+                f"and PAYLOAD: {Fore.LIGHTCYAN_EX}{payload.decode(errors='replace')}{Style.RESET_ALL}"
+            )
 
         try:
             # Route messages to appropriate handlers
-            if topic == self.config["sub"]["topics"]["file_topic"]:
-                self._handle_file_download(payload)
-            elif topic == self.config["sub"]["topics"]["play_pause_cmd_topic"]:
-                self._handle_play_pause_command(payload)
-            elif topic == self.config["sub"]["topics"]["start_stop_cmd_topic"]:
-                self._handle_start_stop_command(payload)
-            elif topic == self.config["sub"]["topics"]["loop_toggle_cmd_topic"]:
-                self._handle_loop_command(payload)
-            elif topic == self.config["sub"]["topics"]["volume_cmd_topic"]:
-                self._handle_volume_command(payload)
-            elif topic == self.config["sub"]["topics"]["seek_cmd_topic"]:
-                self._handle_seek_command(payload)
-            elif topic == self.config["sub"]["topics"]["status_check"]:
-                self._handle_status_request(payload)
-            elif topic == self.config["sub"]["topics"]["channel_mask_cmd_topic"]:
-                self._handle_channel_mask_command(payload)
-            elif topic == self.config["sub"]["topics"]["repeat_cmd_topic"]:
-                self._handle_repeat_command(payload)
+            handler = self._handlers.get(topic)
+            if handler:
+                handler(payload)
             else:
                 print(f"\r[MQTT] ⚠ Unknown topic: {topic}")
 
@@ -358,11 +573,11 @@ class MQTTAudioClient:
                 print(f"\r[MQTT] Channel mask rejected: {channel_mask}")
 
         except json.JSONDecodeError as e:
-            print(f"\r[MQTT] Invalid JSON in channel mask payload: {payload}")
+            print(f"\r[MQTT] Invalid JSON in channel mask payload: {payload.decode(errors='replace')}")
             print("\r[MQTT] JSON Error")
         except Exception as e:
             print(f"\r[MQTT] Channel mask processing error: {e}")
-            print(f"\r[MQTT] Payload was: {payload}")
+            print(f"\r[MQTT] Payload was: {payload.decode(errors='replace')}")
 
     def _handle_repeat_command(self, payload):
         """Handle repeat playback commands"""
@@ -371,6 +586,8 @@ class MQTTAudioClient:
             repeat_data = json.loads(payload)
             
             # Extract parameters
+            if not isinstance(repeat_data, dict):
+                raise ValueError(f"expected JSON object, got {type(repeat_data).__name__}")
             count = int(repeat_data.get("count", 1))
             interval = float(repeat_data.get("interval", 0.0))
             
@@ -381,7 +598,6 @@ class MQTTAudioClient:
                 return
             
             # Validation: count must be 1-10
-            MAX_REPEAT_COUNT = 10
             if not (1 <= count <= MAX_REPEAT_COUNT):
                 print(
                     f"\r[MQTT] {Fore.LIGHTRED_EX}Invalid repeat count:{Style.RESET_ALL} "
@@ -390,7 +606,6 @@ class MQTTAudioClient:
                 return
             
             # Validation: interval must be 0-30 seconds
-            MAX_REPEAT_INTERVAL = 30.0
             if not (0 <= interval <= MAX_REPEAT_INTERVAL):
                 print(
                     f"\r[MQTT] {Fore.LIGHTRED_EX}Invalid repeat interval:{Style.RESET_ALL} "
@@ -406,13 +621,14 @@ class MQTTAudioClient:
             
         except json.JSONDecodeError:
             print(
-                f"\r[MQTT] {Fore.LIGHTRED_EX}Invalid JSON in repeat payload:{Style.RESET_ALL} {payload}"
+                f"\r[MQTT] {Fore.LIGHTRED_EX}Invalid JSON in repeat payload:{Style.RESET_ALL} "
+                f"{payload.decode(errors='replace')}"
             )
         except (ValueError, KeyError) as e:
             print(
                 f"\r[MQTT] {Fore.LIGHTRED_EX}Invalid repeat command:{Style.RESET_ALL} {e}"
             )
-            print(f"\r[MQTT] Payload was: {payload}")
+            print(f"\r[MQTT] Payload was: {payload.decode(errors='replace')}")
         except Exception as e:
             print(f"\r[MQTT] Repeat command processing error: {e}")
     
@@ -422,9 +638,9 @@ class MQTTAudioClient:
             # Try JSON first
             url_data = json.loads(payload)
             url = url_data.get("url") or url_data.get("audio_url") or str(url_data)
-        except json.JSONDecodeError:
+        except (json.JSONDecodeError, UnicodeDecodeError):
             # Fallback to direct URL string
-            url = payload
+            url = payload.decode()
 
         # Handle both URLs and absolute paths
         if url and url.startswith(("http://", "https://")):
@@ -448,9 +664,9 @@ class MQTTAudioClient:
 
     def _handle_play_pause_command(self, payload):
         """Handle play/pause commands"""
-        command = payload.lower().strip()
-        if command in ["play", "start"]:
-            if self.player.state.value == "stopped":
+        command = payload.decode().lower().strip()
+        if command in _PLAY_WORDS:
+            if self.player.state is _STOPPED:
                 self.player.start_playback()
                 print("\r[MQTT] Start command executed")
             else:
@@ -462,8 +678,8 @@ class MQTTAudioClient:
 
     def _handle_start_stop_command(self, payload):
         """Handle start/stop commands"""
-        command = payload.lower().strip()
-        if command in ["start", "play"]:
+        command = payload.decode().lower().strip()
+        if command in _PLAY_WORDS:
             self.player.start_playback()
             print("\r[MQTT] Start command executed")
         elif command == "stop":
@@ -488,16 +704,18 @@ class MQTTAudioClient:
         if isinstance(payload, bool):
             loop_enabled = payload
         else:
-            payload_str = str(payload).lower().strip()
-            loop_enabled = payload_str in ["true", "1", "yes", "on", "enable"]
+            payload_str = payload.decode().lower().strip()
+            loop_enabled = payload_str in _LOOP_TRUE
+
+        # Nothing to do if the loop state doesn't change
+        if self.player.loop_enabled == loop_enabled:
+            return
 
         # Update loop state regardless of repeat mode
-        old_loop = self.player.loop_enabled
         self.player.loop_enabled = loop_enabled
         
         # Publish state change immediately
-        if old_loop != loop_enabled:
-            self.player.check_and_publish_state_changes()
+        self.player.check_and_publish_state_changes()
         
         loop_status = "ENABLED" if loop_enabled else "DISABLED"
         
@@ -509,7 +727,8 @@ class MQTTAudioClient:
 
     def _handle_volume_command(self, payload):
         """Handle volume commands"""
-        payload_str = str(payload).strip()
+        payload = payload.decode()
+        payload_str = payload.strip()
 
         if payload_str.startswith("+"):
             self.player.volume_up()
@@ -536,23 +755,33 @@ class MQTTAudioClient:
     def _handle_seek_command(self, payload):
         """Handle seek commands"""
         # payload_str = str(payload).strip()
-        payload_str = str(payload).strip().strip('"').strip("'")
+        payload = payload.decode()
+        payload_str = payload.strip().strip('"').strip("'")
 
-        try:
-            # Parse time format (MM:SS or seconds)
+        # One match covers the common formats: MM:SS, percentage or plain seconds
+        match = _SEEK_RE.match(payload_str)
+        if match:
+            minutes, seconds, percent, plain_seconds = match.groups()
+        else:
+            # Anything else ("+5", "1e2", "50 %", negatives, ...) goes through
+            # int()/float() below, which decide whether it's a number at all
+            minutes = seconds = percent = plain_seconds = None
             if ":" in payload_str:
                 parts = payload_str.split(":")
-                if len(parts) == 2:
-                    minutes = int(parts[0])
-                    seconds = int(parts[1])
-                    target_seconds = minutes * 60 + seconds
-                else:
-                    print(
-                        f"\r[MQTT] {Fore.LIGHTRED_EX}Invalid seek format{Style.RESET_ALL}"
-                    )
+                if len(parts) != 2:
+                    print(f"\r[MQTT] {Fore.LIGHTRED_EX}Invalid seek format{Style.RESET_ALL}")
                     return
+                minutes, seconds = parts
             elif payload_str.endswith("%"):
-                percentage = float(payload_str[:-1])  # Remove % and convert
+                percent = payload_str[:-1]
+            else:
+                plain_seconds = payload_str
+
+        try:
+            if minutes is not None:
+                target_seconds = int(minutes) * 60 + int(seconds)
+            elif percent is not None:
+                percentage = float(percent)
                 # print(f"\r[DEBUG] percentage: {percentage}")
                 if 0 <= percentage <= 100 and self.player.audio_length > 0:
                     total_duration_seconds = (
@@ -565,7 +794,7 @@ class MQTTAudioClient:
                     )
                     return
             else:
-                target_seconds = float(payload_str)
+                target_seconds = float(plain_seconds)
 
             if self.player.seek_to_time(target_seconds):
                 target_time = self.player.get_time_string(self.player.position)
@@ -587,7 +816,7 @@ class MQTTAudioClient:
         self.player.publish_player_state()
 
         # Also publish position if playing
-        if self.player.state.value == "playing":
+        if self.player.state is _PLAYING:
             position_topic = self.config["pub"]["topics"]["audio_position"]
             position_samples = self.player.position
             total_samples = self.player.audio_length
@@ -600,7 +829,9 @@ class MQTTAudioClient:
                 "total_duration": self.player.get_total_time_string(),
                 "percentage": round(percentage, 1),
             }
-            self.client.publish(position_topic, json.dumps(position_data), retain=True)
+            self._enqueue_publish(
+                position_topic, _dumps(position_data), retain=True, drop_ok=False
+            )
 
     def publish_download_state(self, download_state, additional_info=None):
         """Publish download state updates"""
@@ -632,7 +863,7 @@ class MQTTAudioClient:
             if additional_info:
                 state_data.update(additional_info)
 
-            self.client.publish(status_topic, json.dumps(state_data))
+            self._enqueue_publish(status_topic, _dumps(state_data), drop_ok=False)
             print(f"\r[MQTT] >>> Download state: {download_state}")
 
         except Exception as e:
@@ -647,6 +878,7 @@ class MQTTAudioClient:
             return {
                 "connected": is_connected,
                 "messages_rx": self.messages_received,
+                "publishes_dropped": self.publishes_dropped,
                 "last_activity": time.time() - self.last_message_time
             }
         except Exception:
@@ -4,8 +4,13 @@ Audio Player class with MQTT integration and real-time controls.
 
 import os
 import json
+import hashlib
+import functools
+import math
 import queue
 import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from enum import Enum
 
 import time
@@ -16,6 +21,43 @@ import soundfile as sf
 import sounddevice as sd
 from colorama import Fore, Style
 
+from player.utils import find_device_by_name, get_devices
+
+
+# Set REPEAT_DEBUG=1 to print every repeat cycle (start, finish, interval wait)
+REPEAT_DEBUG = bool(int(os.environ.get("REPEAT_DEBUG", "0")))
+
+# Resample with the old FFT-based signal.resample instead of polyphase filtering
+USE_FFT_RESAMPLE = False
+
+# Frames decoded per block when mixing multichannel files down to mono
+LOAD_BLOCK_FRAMES = 65536
+
+# Resampled audio can be cached on disk so reloading a file skips decode + resample
+# (opt-in, size limit per player via resample_cache_max_mb)
+RESAMPLE_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "py_mqtt_audio_player")
+
+# Samples per precomputed RMS window (matches the default stream blocksize)
+RMS_WINDOW = 1024
+
+# Volume-scaled copies of the mono audio kept around (each is one full track)
+SCALED_AUDIO_CACHE_SIZE = 2
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_mm_ss(total_seconds):
+    """Format whole seconds as MM:SS (cached: positions repeat every status update)"""
+    minutes, seconds = divmod(total_seconds, 60)
+    return f"{minutes:02d}:{seconds:02d}"
+
+
+@dataclass(slots=True)
+class PlaybackHealth:
+    """Stall-detection bookkeeping for check_playback_health"""
+    last_position_update: int  # time.monotonic_ns()
+    stalled_count: int = 0
+    position_check_interval: float = 5.0  # Increased from 2.0 to 5.0 seconds
+
 
 class PlayerState(Enum):
     STOPPED = "stopped"
@@ -23,22 +65,9 @@ class PlayerState(Enum):
     PAUSED = "paused"
 
 
-def find_device_by_name(device_name):
-    """Find a device by its name and return its index, preferring output devices."""
-    devices = sd.query_devices()
-    
-    # First pass: exact match among OUTPUT devices only
-    for device in devices:
-        if (device["name"] == device_name and 
-            device["max_output_channels"] > 0):
-            return device['index']  # ← Correct device index
-    
-    # Fallback
-    for device in devices:
-        if device["name"] == device_name:
-            return device['index']
-    
-    return None
+# Module-level alias so the audio callback's state check is a plain identity test
+_PLAYING = PlayerState.PLAYING
+
 
 class AudioPlayer:
     def __init__(
@@ -50,6 +79,9 @@ class AudioPlayer:
         channel_mapping=None,
         volume_step=0.25,
         audio_level_enabled=False,
+        blocksize=1024,
+        latency="high",
+        resample_cache_max_mb=0,
     ):
         # Device configuration
         self.device = device
@@ -68,7 +100,7 @@ class AudioPlayer:
         #  For Troubleshooting device info between OSs
         if self.device_index is not None:
             try:
-                device_info = sd.query_devices(self.device_index)
+                device_info = get_devices()[self.device_index]
                 print(f"{Fore.CYAN}[DEVICE] Resolved device: {device_info['name']} (index: {self.device_index}){Style.RESET_ALL}")
             except Exception as e:
                 print(f"{Fore.RED}[DEVICE] Error querying device {self.device_index}: {e}{Style.RESET_ALL}")
@@ -80,6 +112,11 @@ class AudioPlayer:
         self.target_channels = target_channels
         self.channel_mapping = channel_mapping or [1] * target_channels
         self.dynamic_channel_mask = None  # ** Dynamic channel mask support: Will override channel_mapping when set
+        # Stream buffering: blocksize 0 lets PortAudio pick; latency is 'low', 'high' or seconds
+        self.blocksize = blocksize
+        self.latency = latency
+        # Total size limit of the on-disk resample cache (0 disables it)
+        self.resample_cache_max_bytes = int(resample_cache_max_mb) * 1024 * 1024
 
         # Volume control
         self.initial_volume_factor = volume_factor
@@ -87,15 +124,28 @@ class AudioPlayer:
         self.volume_step = volume_step
         self.original_audio_data = None
 
-        # Player state
+        # Player state (change it via _set_state so playing_event stays in sync)
         self.state = PlayerState.STOPPED
-        self.loop_enabled = False
+        self.playing_event = threading.Event()  # Set while state is PLAYING
+        # Notified on every state/loop/cancel change, so the repeat worker waits
+        # for transitions instead of polling
+        self.state_cv = threading.Condition()
+        self._loop_enabled = False
         self.position = 0
         self.audio_data = None
         self.multichannel_audio = None
-        self.multichannel_template = None
-        self.resampled_original = None
+        self.resampled_original = None  # Mono float32 source, shared by all output channels
+        self.channel_template = None  # Indices of output channels that play resampled_original
+        self._mono_block = np.empty(1024, dtype=np.float32)  # Scratch for one scaled block
+        # Pre-scaled audio for the current volume: (source array, volume, scaled array).
+        # Built by the control worker so the callback can copy instead of multiply.
+        self._active_scaled = (None, None, None)
+        self._scaled_cache = OrderedDict()  # volume -> scaled array (for _scaled_source)
+        self._scaled_source = None
+        self._rescale_requested = False
+        self._window_rms = None  # Mono RMS per RMS_WINDOW samples, for level metering
         self.stream = None
+        self._stream_pool = {}  # Opened streams by channel count, reused on mask switches
         self.audio_length = 0
 
         # Repeat mode state
@@ -115,28 +165,53 @@ class AudioPlayer:
             self.level_normalization_factor = 1.0  # Will adapt dynamically
             self.normalized_audio_level = 0.0
 
-        # Threading and control
-        self.control_queue = queue.Queue()
+        # Threading and control.
+        # Commands are applied by a worker thread, never on the audio callback:
+        # the callback only reads plain attributes (state, volume, position).
+        # SimpleQueue.put never takes a lock or blocks, so the callback can
+        # post its "_ended"/"_rescale" notices; only the worker's get() waits.
+        self.control_queue = queue.SimpleQueue()
+        # Command -> handler, looked up once per command by the worker
+        self._command_handlers = {
+            "pause": self._do_pause,
+            "play": self._do_play,
+            "stop": self._do_stop,
+            "start": self._do_start,
+            "volume_up": self._do_volume_up,
+            "volume_down": self._do_volume_down,
+        }
+        self._notice_handlers = {
+            "_rescale": self._on_rescale,
+            "_swapped": self._on_swapped,
+            "_looped": self._on_looped,
+            "_ended": self._on_ended,
+        }
         self.stop_event = threading.Event()
+        self._reset_position = False  # Set by the worker, consumed by the callback
+        self._control_thread = threading.Thread(
+            target=self._control_worker, daemon=True
+        )
         
         # NEW - Playback health monitoring
-        self.playback_health = {
-            'last_position_update': time.time(),
-            'stalled_count': 0,
-            'position_check_interval': 5.0,  # Increased from 2.0 to 5.0 seconds
-            'callback_calls': 0,
-            'callback_errors': 0,
-            'last_error_time': None
-        }
+        self.playback_health = PlaybackHealth(last_position_update=time.monotonic_ns())
+        # Callback counters are plain attributes: the audio callback only bumps
+        # ints, no dict stores or clock reads. The last error is recorded as the
+        # callback count it happened at.
+        self._callback_calls = 0
+        self._callback_errors = 0
+        self._last_error_call = None
         # ---
 
-        # Atomic template swapping infrastructure
-        self._pending_template = None  # New template waiting to be swapped
-        self._pending_template_mapping = None  # Channel mapping for pending template
+        # Atomic template swapping infrastructure (lock-free for the audio callback).
+        # The producer stores a new (template, mapping) tuple in the slot with one
+        # reference assignment; the callback applies it when it differs from the
+        # last one it applied. The slot is never cleared, so no update can be lost.
+        self._pending_slot = [None]
+        self._applied_pending = None
+        self._swapped_from = None  # Mapping replaced by the last swap (for logging)
         self._template_swap_lock = (
             threading.Lock()
-        )  # Thread safety for template operations
-        self._template_creation_thread = None  # Background thread for template creation
+        )  # Serializes producers only; the callback never takes it
 
         # MQTT integration
         self.mqtt_client = None
@@ -144,6 +219,8 @@ class AudioPlayer:
         self._last_published_state = None
         self._last_published_volume = None
 
+        self._control_thread.start()
+
     def set_mqtt_client(self, client):
         """
         Set MQTT client for state publishing.
@@ -242,13 +319,27 @@ class AudioPlayer:
                 )
                 return False, None
 
-        # Now validate all values are 0 or 1
-        for i, value in enumerate(processed_mask):
-            if not isinstance(value, int) or value not in [0, 1]:
-                print(
-                    f"\r[CHANNEL_MASK] Invalid mask value at index {i}: expected 0 or 1, got {value}"
-                )
-                return False, None
+        # Now validate all values are 0 or 1, as one array check
+        try:
+            values = np.asarray(processed_mask)
+        except ValueError:  # Ragged nested lists
+            values = np.asarray(processed_mask, dtype=object)
+
+        if values.ndim != 1 or values.dtype.kind not in "iub":
+            # Not all plain integers: report the first offending entry
+            i = next(
+                (i for i, v in enumerate(processed_mask) if not isinstance(v, int)), 0
+            )
+            bad = [i]
+        else:
+            bad = np.flatnonzero((values != 0) & (values != 1))
+
+        if len(bad):
+            i = int(bad[0])
+            print(
+                f"\r[CHANNEL_MASK] Invalid mask value at index {i}: expected 0 or 1, got {processed_mask[i]}"
+            )
+            return False, None
 
         print(f"\r[CHANNEL_MASK] Valid mask: {processed_mask}")
         if original_length != len(processed_mask):
@@ -279,7 +370,7 @@ class AudioPlayer:
             if self.state == PlayerState.PLAYING:
                 # Audio is playing - trigger instant switching!
                 print("\r[CHANNEL_MASK] ⚡ Audio playing - triggering INSTANT switch")
-                self._create_template_async(processed_mask)
+                self._queue_template_swap(processed_mask)
             else:
                 # Audio not playing - use traditional behavior
                 print(
@@ -304,12 +395,15 @@ class AudioPlayer:
             else self.channel_mapping
         )
 
-    def _create_multichannel_template(self, channel_mapping):
+    def _create_channel_template(self, channel_mapping):
         """
-        Create multichannel audio template for given channel mapping.
-        
+        Create the channel template for given channel mapping.
+
+        The mono buffer is not duplicated per channel: the template is just the
+        list of output channel indices the callback copies it into.
+
         Returns:
-            numpy.ndarray or None: Multichannel template (samples x channels), or None on failure
+            numpy.ndarray or None: Enabled channel indices, or None on failure
         """
         if self.resampled_original is None:
             print("\r[TEMPLATE] No resampled audio data available")
@@ -317,62 +411,38 @@ class AudioPlayer:
 
         print(f"\r[TEMPLATE] Creating template with mapping: {channel_mapping}")
 
-        # Create multichannel template (samples x channels)
-        template = np.zeros((len(self.resampled_original), len(channel_mapping)))
+        template = np.flatnonzero(channel_mapping)
 
-        # Fill enabled channels with audio data
-        for channel_idx, enabled in enumerate(channel_mapping):
-            if enabled:
-                template[:, channel_idx] = self.resampled_original
-
-        print(f"\r[TEMPLATE] Created template: {template.shape} (samples x channels)")
+        print(
+            f"\r[TEMPLATE] Created template: {len(self.resampled_original)} samples -> "
+            f"channels {template.tolist()} of {len(channel_mapping)}"
+        )
         return template
 
-    def _create_template_async(self, channel_mapping):
+    def _queue_template_swap(self, channel_mapping):
         """
-        Create multichannel template in background thread for atomic swapping.
-        
-        Enables glitch-free channel mask changes during playback by preparing
-        new template in background and swapping atomically in audio callback.
-        
+        Prepare a channel template for atomic swapping in the audio callback.
+
+        Enables glitch-free channel mask changes during playback. Building the
+        template is cheap (an index list), so no background thread is needed.
+
         Args:
             channel_mapping (list): New channel mask to apply
         """
+        try:
+            new_template = self._create_channel_template(channel_mapping)
 
-        def background_template_creation():
-            try:
-                print(f"\r[INSTANT] Creating template in background: {channel_mapping}")
-
-                # Create new template (this can take time, but it's in background)
-                new_template = self._create_multichannel_template(channel_mapping)
-
-                if new_template is not None:
-                    # Atomically set the pending template (thread-safe)
-                    with self._template_swap_lock:
-                        self._pending_template = new_template
-                        self._pending_template_mapping = channel_mapping.copy()
-
-                    print(
-                        f"\r[INSTANT] Background template ready for swap: {channel_mapping}"
-                    )
-                else:
-                    print("\r[INSTANT] Background template creation failed")
+            if new_template is not None:
+                # Atomically set the pending template (thread-safe)
+                with self._template_swap_lock:
+                    self._pending_slot[0] = (new_template, channel_mapping.copy())
 
-            except Exception as e:
-                print(f"\r[INSTANT] Background template error: {e}")
+                print(f"\r[INSTANT] Template ready for swap: {channel_mapping}")
+            else:
+                print("\r[INSTANT] Template creation failed")
 
-        # Start background thread (don't block MQTT handler)
-        if (
-            self._template_creation_thread is None
-            or not self._template_creation_thread.is_alive()
-        ):
-            self._template_creation_thread = threading.Thread(
-                target=background_template_creation
-            )
-            self._template_creation_thread.daemon = True
-            self._template_creation_thread.start()
-        else:
-            print("\r[INSTANT] Template creation already in progress, ignoring request")
+        except Exception as e:
+            print(f"\r[INSTANT] Template error: {e}")
 
     def _check_and_swap_pending_template(self):
         """
@@ -382,35 +452,18 @@ class AudioPlayer:
         Returns:
             bool: True if template was swapped, False if no pending template
         """
-        # Quick check without lock first (performance optimization)
-        if self._pending_template is None:
+        # Single reference load, no lock
+        pending = self._pending_slot[0]
+        if pending is None or pending is self._applied_pending:
             return False
 
-        # Atomic swap (very fast operation)
-        try:
-            with self._template_swap_lock:
-                if self._pending_template is not None:
-                    # Swap templates atomically
-                    old_mapping = getattr(self, "_template_channel_mapping", None)
-
-                    self.multichannel_template = self._pending_template
-                    self._template_channel_mapping = (
-                        self._pending_template_mapping.copy()
-                    )
-                    self.audio_length = len(self.multichannel_template)
-
-                    # Clear pending template
-                    self._pending_template = None
-                    self._pending_template_mapping = None
-
-                    print(
-                        f"\r[INSTANT] ⚡ Template swapped! {old_mapping} → {self._template_channel_mapping}"
-                    )
-                    return True
-        except Exception as e:
-            print(f"\r[INSTANT] Template swap error: {e}")
+        self._swapped_from = getattr(self, "_template_channel_mapping", None)
+        self.channel_template, self._template_channel_mapping = pending
+        self._applied_pending = pending
 
-        return False
+        # Console output happens on the control worker
+        self.control_queue.put("_swapped")
+        return True
 
     def load_audio_file(self, audio_file):
         """
@@ -424,48 +477,31 @@ class AudioPlayer:
         )
 
         try:
-            # Load audio data and get original sample rate
-            audio_data_array, orig_sample_rate = sf.read(audio_file)
-
-            print(f"\r  • Original sample rate: {orig_sample_rate} Hz")
-            print(
-                f"\r  • Audio duration: {len(audio_data_array) / orig_sample_rate:.2f} seconds"
-            )
-            print(f"\r  • Audio shape: {audio_data_array.shape}")
-
-            # Convert to mono if stereo
-            if len(audio_data_array.shape) > 1:
-                audio_data_array = np.mean(audio_data_array, axis=1)
-                print("\r  • Converted to mono")
-
-            # Store original audio data (no volume applied yet)
-            self.original_audio_data = audio_data_array
-
-            # Resample the original audio data
-            new_length = int(
-                len(self.original_audio_data)
-                * self.target_sample_rate
-                / orig_sample_rate
-            )
-
-            self.resampled_original = signal.resample(
-                self.original_audio_data, new_length
-            )
+            self.original_audio_data = None  # Only kept when decoding (cache miss)
+            # One open handle serves both the cache key (sample rate) and decoding
+            with sf.SoundFile(audio_file) as f:
+                cache_path = self._resample_cache_path(audio_file, f.samplerate)
+                self.resampled_original = self._load_resample_cache(cache_path)
+                if self.resampled_original is None:
+                    self.resampled_original = self._decode_audio_file(f)
+                    if cache_path is not None:
+                        self._store_resample_cache(cache_path, self.resampled_original)
 
             # Use active channel mapping instead of self.channel_mapping
             active_channel_mapping = self.get_active_channel_mapping()
 
             print(f"\r  Using channel mapping: {active_channel_mapping}")
 
-            self.multichannel_template = self._create_multichannel_template(
+            self.channel_template = self._create_channel_template(
                 active_channel_mapping
             )
 
-            if self.multichannel_template is None:
+            if self.channel_template is None:
                 print(f"\r{Fore.RED}Failed to create audio template{Style.RESET_ALL}")
                 return False
 
-            self.audio_length = len(self.multichannel_template)
+            self._compute_window_rms()
+            self.audio_length = len(self.resampled_original)
             self.position = 0
 
             # Remember which mapping was used for this template
@@ -478,6 +514,131 @@ class AudioPlayer:
             print(f"\r{Fore.RED}Error loading audio file: {e}{Style.RESET_ALL}")
             return False
 
+    def _decode_audio_file(self, f):
+        """
+        Decode an open SoundFile to mono float32 at the target sample rate.
+
+        Returns:
+            numpy.ndarray: Resampled mono audio
+        """
+        # Load audio data and get original sample rate.
+        # Decoded straight into one preallocated mono float32 array (the stream
+        # dtype); multichannel files are mixed down block by block, so the full
+        # multichannel data never has to sit in RAM (matters for long WAVs)
+        orig_sample_rate = f.samplerate
+        channels = f.channels
+        audio_data_array = np.empty(f.frames, dtype=np.float32)
+        if channels == 1:
+            frames_read = len(f.read(out=audio_data_array))
+        else:
+            block = np.empty((LOAD_BLOCK_FRAMES, channels), dtype=np.float32)
+            frames_read = 0
+            while frames_read < len(audio_data_array):
+                chunk = f.read(out=block)
+                if len(chunk) == 0:
+                    break
+                np.mean(
+                    chunk,
+                    axis=1,
+                    out=audio_data_array[frames_read : frames_read + len(chunk)],
+                )
+                frames_read += len(chunk)
+        audio_data_array = audio_data_array[:frames_read]
+
+        print(f"\r  • Original sample rate: {orig_sample_rate} Hz")
+        print(
+            f"\r  • Audio duration: {frames_read / orig_sample_rate:.2f} seconds"
+        )
+        print(f"\r  • Audio shape: {(frames_read, channels) if channels > 1 else (frames_read,)}")
+
+        if channels > 1:
+            print("\r  • Converted to mono")
+
+        # Store original audio data (no volume applied yet)
+        self.original_audio_data = audio_data_array
+
+        # Resample the original audio data
+        if orig_sample_rate == self.target_sample_rate:
+            resampled = self.original_audio_data
+        elif USE_FFT_RESAMPLE:
+            new_length = int(
+                len(self.original_audio_data)
+                * self.target_sample_rate
+                / orig_sample_rate
+            )
+            resampled = signal.resample(self.original_audio_data, new_length)
+        else:
+            # Polyphase filter (built-in Kaiser window): linear time, no
+            # whole-file FFT, so no slowdown on awkward lengths
+            target_rate = int(self.target_sample_rate)
+            g = math.gcd(target_rate, orig_sample_rate)
+            resampled = signal.resample_poly(
+                self.original_audio_data,
+                target_rate // g,
+                orig_sample_rate // g,
+            )
+        return resampled.astype(np.float32, copy=False)
+
+    def _resample_cache_path(self, audio_file, orig_sample_rate):
+        """
+        Disk cache path for the resampled audio of audio_file, keyed by its
+        path, modification time and the target rate. None when the cache is
+        disabled or the file is already at the target rate (nothing to save).
+        """
+        if not self.resample_cache_max_bytes or orig_sample_rate == self.target_sample_rate:
+            return None
+        stat = os.stat(audio_file)
+        key = hashlib.sha1(
+            f"{os.path.abspath(audio_file)}|{stat.st_mtime_ns}|{stat.st_size}|"
+            f"{self.target_sample_rate}|{USE_FFT_RESAMPLE}".encode()
+        ).hexdigest()
+        return os.path.join(RESAMPLE_CACHE_DIR, f"{key}.npy")
+
+    def _load_resample_cache(self, cache_path):
+        """Load cached resampled audio, or None on a miss"""
+        if cache_path is None or not os.path.exists(cache_path):
+            return None
+        try:
+            # Read fully (no mmap) so the audio callback never hits a page fault
+            resampled = np.load(cache_path)
+            os.utime(cache_path)  # Mark as recently used for eviction
+        except Exception as e:
+            print(f"\r[CACHE] Ignoring unreadable resample cache: {e}")
+            return None
+        print("\r  • Using cached resampled audio")
+        return resampled
+
+    def _store_resample_cache(self, cache_path, resampled):
+        """
+        Save resampled audio to the disk cache, then evict least recently used
+        entries until the cache fits in resample_cache_max_bytes.
+        """
+        if resampled.nbytes > self.resample_cache_max_bytes:
+            return  # Would evict everything and still not fit
+        try:
+            os.makedirs(RESAMPLE_CACHE_DIR, exist_ok=True)
+            tmp_path = cache_path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                np.save(f, resampled)
+            os.replace(tmp_path, cache_path)
+
+            entries = sorted(
+                (
+                    (entry.stat(), entry.path)
+                    for entry in os.scandir(RESAMPLE_CACHE_DIR)
+                    if entry.name.endswith(".npy")
+                ),
+                key=lambda item: item[0].st_mtime,
+                reverse=True,
+            )
+            total = 0
+            for stat, path in entries:
+                total += stat.st_size
+                if total > self.resample_cache_max_bytes:
+                    os.remove(path)
+        except Exception as e:
+            print(f"\r[CACHE] Could not save resampled audio: {e}")
+
     def get_time_string(self, position_samples):
         """
         Convert sample position to time string (MM:SS).
@@ -488,10 +649,7 @@ class AudioPlayer:
         Returns:
             str: Time string in MM:SS format
         """
-        seconds = position_samples / self.target_sample_rate
-        minutes = int(seconds // 60)
-        seconds = int(seconds % 60)
-        return f"{minutes:02d}:{seconds:02d}"
+        return _format_mm_ss(int(position_samples // self.target_sample_rate))
 
     def get_total_time_string(self):
         """
@@ -526,20 +684,8 @@ class AudioPlayer:
 
         return f"[{state_str:7}] {current_time}/{total_time} [{loop_str}] [{volume_str:8}] | S:Start/Stop P:Play/Pause L:Loop +/-:Volume Q:Quit"
 
-    def calculate_rms_level(self, audio_chunk):
-        """
-        Calculate RMS (Root Mean Square) level from audio chunk.
-        
-        Args:
-            audio_chunk (numpy.ndarray): Audio chunk to analyze
-        
-        Returns:
-            float: Normalized RMS level (0.0-1.0)
-        """
-        if not self.audio_level_enabled or audio_chunk is None or len(audio_chunk) == 0:
-            return 0.0
-        # Calculate RMS across all channels
-        rms = np.sqrt(np.mean(audio_chunk**2))
+    def _smooth_level(self, rms):
+        """Smooth and normalize a raw RMS value into the 0.0-1.0 level"""
         # Apply smoothing
         self.current_audio_level = (
             self.current_audio_level * (1 - self.level_smoothing_factor)
@@ -551,6 +697,39 @@ class AudioPlayer:
         )
         return normalized_level
 
+    def _compute_window_rms(self):
+        """
+        Precompute the mono RMS of every RMS_WINDOW-sample window of the loaded
+        audio, so the callback's level metering is a lookup instead of a pass
+        over each block.
+        """
+        mono = self.resampled_original
+        if not self.audio_level_enabled or mono is None or len(mono) == 0:
+            self._window_rms = None
+            return
+        starts = np.arange(0, len(mono), RMS_WINDOW)
+        sums = np.add.reduceat(np.square(mono, dtype=np.float32), starts)
+        counts = np.diff(np.append(starts, len(mono)))
+        self._window_rms = np.sqrt(sums / counts).astype(np.float32)
+
+    def _level_at(self, position):
+        """
+        Audio level for the block starting at `position` (audio callback).
+        Uses the precomputed window RMS, scaled by volume and by the share of
+        enabled channels (disabled ones output silence).
+        """
+        window_rms = self._window_rms
+        if window_rms is None:
+            return self.normalized_audio_level
+        window = min(position // RMS_WINDOW, len(window_rms) - 1)
+        channel_share = len(self.channel_template) / len(self._template_channel_mapping)
+        rms = (
+            float(window_rms[window])
+            * abs(self.current_volume_factor)
+            * math.sqrt(channel_share)
+        )
+        return self._smooth_level(rms)
+
     def _get_repeat_state(self):
         """
         Get current repeat state for status reporting.
@@ -636,62 +815,157 @@ class AudioPlayer:
         Called by sounddevice for each audio buffer. Handles playback and monitoring.
         """
         # Increment callback counter
-        self.playback_health['callback_calls'] += 1
+        self._callback_calls += 1
         
         # Log any audio system warnings/errors
         if status:
-            self.playback_health['callback_errors'] += 1
-            self.playback_health['last_error_time'] = time.time()
+            self._callback_errors += 1
+            self._last_error_call = self._callback_calls
 
-        # Process control commands
-        self._process_control_commands()
-
-        if self.state != PlayerState.PLAYING:
+        if self.state is not _PLAYING:
             outdata.fill(0)
             return
 
         # Handle audio playback
         self._handle_audio_playback(outdata, frames)
 
-    def _process_control_commands(self):
+    def _set_state(self, new_state):
+        """Update player state and mirror PLAYING into playing_event"""
+        self.state = new_state
+        if new_state == PlayerState.PLAYING:
+            self.playing_event.set()
+        else:
+            self.playing_event.clear()
+        self._notify_state_waiters()
+
+    def _notify_state_waiters(self):
+        """Wake threads waiting on state_cv for a state change"""
+        with self.state_cv:
+            self.state_cv.notify_all()
+
+    @property
+    def loop_enabled(self):
+        return self._loop_enabled
+
+    @loop_enabled.setter
+    def loop_enabled(self, enabled):
+        self._loop_enabled = enabled
+        self._notify_state_waiters()
+
+    def _control_worker(self):
         """
-        Process queued control commands.
-        
-        Handles play, pause, stop, start, volume changes from control queue.
+        Apply queued control commands off the audio thread.
+
+        Handles play, pause, stop, start and volume changes, plus the notices
+        the callback posts ("_ended", "_rescale", ...). State publishing (MQTT)
+        happens here too, never on the audio callback.
         """
-        try:
-            while not self.control_queue.empty():
-                command = self.control_queue.get_nowait()
+        while True:
+            command = self.control_queue.get()
+            try:
+                # Internal notices publish on their own (if at all)
+                handler = self._notice_handlers.get(command)
+                if handler is not None:
+                    handler()
+                    continue
+
+                handler = self._command_handlers.get(command)
+                if handler is None:
+                    print(f"\r[CONTROL] Unknown command: {command}")
+                    continue
+
                 old_state = self.state
                 old_volume = self.current_volume_factor
 
-                if command == "pause":
-                    self.state = PlayerState.PAUSED
-                elif command == "play":
-                    self.state = PlayerState.PLAYING
-                elif command == "stop":
-                    self.state = PlayerState.STOPPED
-                    self.position = 0
-                elif command == "start":
-                    # Check for channel mask changes before starting
-                    self._check_and_update_channel_template()
-                    self.state = PlayerState.PLAYING
-                    self.position = 0
-                elif command == "volume_up":
-                    self.current_volume_factor = min(
-                        2.0, self.current_volume_factor + self.volume_step
-                    )
-                elif command == "volume_down":
-                    self.current_volume_factor = max(
-                        0.0, self.current_volume_factor - self.volume_step
-                    )
+                handler()
 
                 # Check for state changes
                 if old_state != self.state or old_volume != self.current_volume_factor:
                     self.check_and_publish_state_changes()
 
-        except queue.Empty:
-            pass
+            except Exception as e:
+                print(f"\r[CONTROL] Command '{command}' failed: {e}")
+
+    # Control command handlers (control worker)
+    def _do_pause(self):
+        self._set_state(PlayerState.PAUSED)
+
+    def _do_play(self):
+        self._set_state(PlayerState.PLAYING)
+
+    def _do_stop(self):
+        self._set_state(PlayerState.STOPPED)
+        self._request_position_reset()
+
+    def _do_start(self):
+        # Check for channel mask changes before starting
+        self._check_and_update_channel_template()
+        self._request_position_reset()
+        self._set_state(PlayerState.PLAYING)
+
+    def _do_volume_up(self):
+        self.current_volume_factor = min(
+            2.0, self.current_volume_factor + self.volume_step
+        )
+
+    def _do_volume_down(self):
+        self.current_volume_factor = max(
+            0.0, self.current_volume_factor - self.volume_step
+        )
+
+    # Notices posted by the audio callback (control worker)
+    def _on_rescale(self):
+        self._rescale_requested = False
+        self._prepare_scaled_audio()
+
+    def _on_swapped(self):
+        print(
+            f"\r[INSTANT] ⚡ Template swapped! {self._swapped_from} → {self._template_channel_mapping}"
+        )
+
+    def _on_looped(self):
+        # Mask changes made while stopped are picked up at the loop point
+        self._check_and_update_channel_template()
+
+    def _on_ended(self):
+        # The callback already stopped; sync the event and publish
+        self._set_state(self.state)
+        self.check_and_publish_state_changes()
+
+    def _prepare_scaled_audio(self):
+        """
+        Make a volume-scaled copy of the mono audio for the current volume
+        available to the callback (control worker only). Recently used volumes
+        stay cached, so toggling volume up and down doesn't rebuild them.
+        """
+        source = self.resampled_original
+        if source is None:
+            return
+        if source is not self._scaled_source:
+            # New file loaded: old copies are useless
+            self._scaled_cache.clear()
+            self._scaled_source = source
+
+        volume = self.current_volume_factor
+        if volume == 1.0:
+            # Unity gain: play the source itself, no full-track copy
+            self._active_scaled = (source, volume, source)
+            return
+        scaled = self._scaled_cache.get(volume)
+        if scaled is None:
+            scaled = np.multiply(source, volume, dtype=np.float32)
+            self._scaled_cache[volume] = scaled
+            while len(self._scaled_cache) > SCALED_AUDIO_CACHE_SIZE:
+                self._scaled_cache.popitem(last=False)
+        else:
+            self._scaled_cache.move_to_end(volume)
+
+        self._active_scaled = (source, volume, scaled)
+
+    def _request_position_reset(self):
+        """Rewind to the start (the callback re-applies it so a block in flight can't undo it)"""
+        self.position = 0
+        self._reset_position = True
 
     def _handle_audio_playback(self, outdata, frames):
         """
@@ -700,69 +974,101 @@ class AudioPlayer:
         Manages audio buffer filling, looping, and position tracking.
         """
 
-        # NEW: Check for instant template swapping (VERY FAST)
-        self._check_and_swap_pending_template()
+        # NEW: Check for instant template swapping (VERY FAST).
+        # Inline reference check so the common no-swap case costs no call
+        if self._pending_slot[0] is not self._applied_pending:
+            self._check_and_swap_pending_template()
+
+        if self._reset_position:
+            self._reset_position = False
+            self.position = 0
+
+        # Normal playback: the whole block fits before the end of the audio
+        position = self.position
+        end = position + frames
+        if end <= self.audio_length:
+            if self.audio_level_enabled:
+                self.normalized_audio_level = self._level_at(position)
+            self._fill_output(outdata, position)
+            self.position = end
+            return
 
-        remaining = self.audio_length - self.position
+        remaining = self.audio_length - position
 
         if remaining <= 0:
             if self.loop_enabled:
-                self._check_and_update_channel_template()
+                self.control_queue.put("_looped")
                 self.position = 0
                 remaining = self.audio_length
+                if remaining >= frames:
+                    self._fill_output(outdata, 0)
+                    self.position = frames
+                    return
             else:
                 outdata.fill(0)
-                old_state = self.state
-                self.state = PlayerState.STOPPED
-                self.position = 0
-                if old_state != self.state:
-                    self.check_and_publish_state_changes()
+                self._finish_playback()
                 return
 
         if remaining < frames:
             if self.loop_enabled:
                 # Fill partial frame and loop
-                chunk1 = (
-                    self.multichannel_template[
-                        self.position : self.position + remaining
-                    ]
-                    * self.current_volume_factor
-                )
-                outdata[:remaining] = chunk1
-                self._check_and_update_channel_template()
+                self._fill_output(outdata[:remaining], self.position)
+                self.control_queue.put("_looped")
                 self.position = 0
                 remaining_frames = frames - remaining
-                chunk2 = (
-                    self.multichannel_template[:remaining_frames]
-                    * self.current_volume_factor
-                )
-                outdata[remaining:] = chunk2
+                self._fill_output(outdata[remaining:], 0)
                 self.position = remaining_frames
             else:
                 # Fill what we can, pad with zeros
-                chunk = (
-                    self.multichannel_template[
-                        self.position : self.position + remaining
-                    ]
-                    * self.current_volume_factor
-                )
-                outdata[:remaining] = chunk
+                self._fill_output(outdata[:remaining], self.position)
                 outdata[remaining:] = 0
-                old_state = self.state
-                self.state = PlayerState.STOPPED
-                self.position = 0
-                if old_state != self.state:
-                    self.check_and_publish_state_changes()
+                self._finish_playback()
+
+    def _finish_playback(self):
+        """
+        End of audio reached (audio callback): stop and rewind, then let the
+        control worker handle playing_event and state publishing.
+        """
+        self.state = PlayerState.STOPPED
+        self.position = 0
+        self.control_queue.put("_ended")
+
+    def _fill_output(self, out, start):
+        """
+        Write len(out) frames of volume-scaled mono audio, starting at sample
+        `start`, into every enabled channel of out (others are zeroed).
+        Normally a plain copy from the pre-scaled audio; right after a volume
+        change it scales into a reused scratch block until that's rebuilt.
+        """
+        frames = len(out)
+        source, scaled_volume, scaled = self._active_scaled
+        if (
+            source is self.resampled_original
+            and scaled_volume == self.current_volume_factor
+        ):
+            mono = scaled[start : start + frames]
         else:
-            # Normal playback
-            chunk = (
-                self.multichannel_template[self.position : self.position + frames]
-                * self.current_volume_factor
+            if frames > len(self._mono_block):
+                self._mono_block = np.empty(frames, dtype=np.float32)
+            mono = self._mono_block[:frames]
+            np.multiply(
+                self.resampled_original[start : start + frames],
+                self.current_volume_factor,
+                out=mono,
             )
-            outdata[:] = chunk
-            self.position += frames
-            if self.audio_level_enabled:
-                self.normalized_audio_level = self.calculate_rms_level(chunk)
+            # Ask the control worker (once) to build the scaled copy
+            if not self._rescale_requested:
+                self._rescale_requested = True
+                self.control_queue.put("_rescale")
+
+        channels = self.channel_template
+        if len(channels) == out.shape[1]:
+            # Every channel enabled: one broadcast copy writes the interleaved frames
+            np.copyto(out, mono[:, None])
+            return
+        out.fill(0)
+        for channel in channels:
+            out[:, channel] = mono
 
     def start_stream(self):
         """
@@ -774,13 +1080,7 @@ class AudioPlayer:
         active_channel_mapping = self.get_active_channel_mapping()
 
         try:
-            self.stream = sd.OutputStream(
-                samplerate=self.target_sample_rate,
-                channels=len(active_channel_mapping),
-                callback=self.audio_callback,
-                device=self.device_index,
-                blocksize=1024,
-            )
+            self.stream = self._open_stream(len(active_channel_mapping))
             self.stream.start()
             return True
         except Exception as e:
@@ -795,14 +1095,60 @@ class AudioPlayer:
         """
         if self.stream:
             self.stream.stop()
-            self.stream.close()
             self.stream = None
+        self._close_idle_streams()
+
+    def _open_stream(self, channels):
+        """
+        Get a (stopped) output stream with `channels` channels, reusing one
+        opened earlier so switching back to a channel count skips the device open.
+        """
+        stream = self._stream_pool.get(channels)
+        if stream is not None:
+            return stream
+
+        def create():
+            return sd.OutputStream(
+                samplerate=self.target_sample_rate,
+                channels=channels,
+                callback=self.audio_callback,
+                device=self.device_index,
+                blocksize=self.blocksize,
+                latency=self.latency,
+                dtype="float32",  # Same layout as the template: callback copies need no conversion
+            )
+
+        try:
+            stream = create()
+        except Exception:
+            if not self._stream_pool:
+                raise
+            # Some host APIs allow only one open stream per device
+            self._close_idle_streams()
+            stream = create()
+        self._stream_pool[channels] = stream
+        return stream
+
+    def _close_idle_streams(self):
+        """Close every pooled stream except the active one"""
+        for channels, stream in list(self._stream_pool.items()):
+            if stream is not self.stream:
+                try:
+                    stream.close()
+                except Exception as e:
+                    print(f"\r[STREAM] Error closing {channels}-channel stream: {e}")
+                del self._stream_pool[channels]
 
     def _check_and_update_channel_template(self):
         """
-        Check if channel mask changed and update multichannel template if needed.
-        
-        Recreates audio template if channel mapping has changed.
+        Check if channel mask changed and update the channel template if needed
+        (control worker).
+
+        The new template goes through the same pending slot as instant mask
+        swaps, so only the audio callback ever replaces channel_template. If the
+        channel count changes, the old stream is stopped before the template is
+        published and the new stream only starts after, so no callback can index
+        channels the stream it writes to doesn't have.
         """
         if self.resampled_original is None:
             return
@@ -813,13 +1159,21 @@ class AudioPlayer:
         if not hasattr(self, "_template_channel_mapping"):
             self._template_channel_mapping = None
 
+        # A swap for this mapping may already be queued but not yet applied
+        pending = self._pending_slot[0]
+        if (
+            pending is not None
+            and pending is not self._applied_pending
+            and pending[1] == current_active_mapping
+        ):
+            return
+
         # Check if template needs updating:
         # 1. Template doesn't exist
         # 2. Channel count changed
         # 3. Channel mapping changed (THIS WAS MISSING!)
         needs_update = (
-            self.multichannel_template is None
-            or self.multichannel_template.shape[1] != len(current_active_mapping)
+            self.channel_template is None
             or self._template_channel_mapping != current_active_mapping
         )
 
@@ -831,58 +1185,30 @@ class AudioPlayer:
                 f"\r[CHANNEL_MASK] Previous mapping was: {self._template_channel_mapping}"
             )
 
-            # Recreate multichannel template with new mapping
-            self.multichannel_template = self._create_multichannel_template(
-                current_active_mapping
-            )
-
-            self.audio_length = len(self.multichannel_template)
-
-            # Remember which mapping was used for this template
-            self._template_channel_mapping = current_active_mapping.copy()
-
-            print(
-                f"\r[CHANNEL_MASK] Template updated - now using {len(current_active_mapping)} channels: {current_active_mapping}"
-            )
-
-            # Need to restart audio stream with new channel count
-            self._restart_stream_if_needed(current_active_mapping)
+            new_channels = len(current_active_mapping)
+            restart = self.stream is not None and self.stream.channels != new_channels
+            if restart:
+                print(
+                    f"\r[CHANNEL_MASK] Restarting stream: {self.stream.channels} → {new_channels} channels"
+                )
+                # Stop current stream (kept open in the pool for switching back)
+                self.stream.stop()
 
-    def _restart_stream_if_needed(self, new_channel_mapping):
-        """
-        Restart audio stream if channel count changed.
-        
-        Args:
-            new_channel_mapping (list): New channel mapping to apply
-        """
-        if self.stream is None:
-            return
+            # The callback applies it at the start of its next block
+            self._queue_template_swap(current_active_mapping)
 
-        current_channels = self.stream.channels
-        new_channels = len(new_channel_mapping)
+            if restart:
+                # Start a stream with the correct channel count
+                self.stream = self._open_stream(new_channels)
+                self.stream.start()
 
-        if current_channels != new_channels:
             print(
-                f"\r[CHANNEL_MASK] Restarting stream: {current_channels} → {new_channels} channels"
-            )
-
-            # Stop current stream
-            self.stream.stop()
-            self.stream.close()
-
-            # Start new stream with correct channel count
-            self.stream = sd.OutputStream(
-                samplerate=self.target_sample_rate,
-                channels=new_channels,
-                callback=self.audio_callback,
-                device=self.device_index,
-                blocksize=1024,
+                f"\r[CHANNEL_MASK] Template queued - now using {new_channels} channels: {current_active_mapping}"
             )
-            self.stream.start()
 
     def send_command(self, command):
         """
-        Send a command to the audio thread.
+        Send a command to the control worker.
         
         Args:
             command (str): Command to send (e.g., 'play', 'pause', 'stop')
@@ -1028,6 +1354,16 @@ class AudioPlayer:
             
             print(f"\r[REPEAT] Behavior set: {count}x with {interval}s interval (waiting for playback trigger)")
     
+    def snapshot_repeat(self):
+        """
+        Read the repeat parameters together (one lock acquire, no torn reads).
+
+        Returns:
+            tuple: (repeat_enabled, repeat_count, repeat_interval)
+        """
+        with self.repeat_params_lock:
+            return self.repeat_enabled, self.repeat_count, self.repeat_interval
+
     def cancel_repeat(self):
         """
         Cancel repeat playback mode (public interface).
@@ -1050,6 +1386,7 @@ class AudioPlayer:
         """
         self.repeat_enabled = False
         self.repeat_cancel_event.set()
+        self._notify_state_waiters()
         
         # Wait for thread to finish (with timeout)
         if self.repeat_thread and self.repeat_thread.is_alive():
@@ -1063,28 +1400,59 @@ class AudioPlayer:
         Returns:
             bool: True if completed normally, False if interrupted by cancellation
         """
-        # Sleep in small intervals to allow quick cancellation
-        sleep_quantum = 0.1  # Check every 100ms
-        elapsed = 0.0
-        
-        while elapsed < duration:
-            if self.repeat_cancel_event.is_set():
-                return False  # Interrupted by cancel
-            
-            # Check if paused during interval
-            if self.state == PlayerState.PAUSED:
-                # Wait for resume or cancellation
-                while self.state == PlayerState.PAUSED:
-                    if self.repeat_cancel_event.is_set():
-                        return False
-                    time.sleep(0.1)
-                # Resumed - continue interval
-            
-            time.sleep(min(sleep_quantum, duration - elapsed))
-            elapsed += sleep_quantum
+        cancelled = self.repeat_cancel_event.is_set
+        # Absolute deadline, so early wakeups (other state changes) don't drift it
+        deadline = time.monotonic() + duration
         
-        return True  # Completed normally
+        with self.state_cv:
+            while True:
+                if cancelled():
+                    return False  # Interrupted by cancel
+                
+                # Paused during interval: wait for resume or cancellation,
+                # the paused time doesn't count towards the interval
+                if self.state == PlayerState.PAUSED:
+                    paused_at = time.monotonic()
+                    self.state_cv.wait_for(
+                        lambda: self.state != PlayerState.PAUSED or cancelled()
+                    )
+                    deadline += time.monotonic() - paused_at
+                    continue
+                
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return True  # Completed normally
+                self.state_cv.wait(remaining)
     
+    def wait_for_state(self, target, timeout=None):
+        """
+        Block until the player is in `target` state or repeat is cancelled.
+
+        Returns:
+            bool: False if the timeout expired first
+        """
+        with self.state_cv:
+            return self.state_cv.wait_for(
+                lambda: self.state == target or self.repeat_cancel_event.is_set(),
+                timeout,
+            )
+
+    def _wait_while_state(self, state):
+        """
+        Block until the player leaves `state`, the loop gets enabled or repeat
+        is cancelled (repeat worker).
+
+        Returns:
+            bool: True if still in `state` (woken by loop/cancel), False once it left
+        """
+        with self.state_cv:
+            self.state_cv.wait_for(
+                lambda: self.state != state
+                or self.loop_enabled
+                or self.repeat_cancel_event.is_set()
+            )
+            return self.state == state
+
     def _repeat_playback_worker(self):
         """
         Background thread that manages repeat playback cycles.
@@ -1105,20 +1473,21 @@ class AudioPlayer:
                 with self.repeat_params_lock:
                     self.repeat_current = i + 1
                 
-                print(f"\r[REPEAT] Starting play {self.repeat_current}/{self.repeat_count}")
+                if REPEAT_DEBUG:
+                    print(f"\r[REPEAT] Starting play {self.repeat_current}/{self.repeat_count}")
                 
                 # CRITICAL FIX: Call send_command directly, not start_playback()
                 # (start_playback checks repeat_enabled and would try to spawn another worker)
                 self.send_command("start")
                 
                 # Give playback a moment to actually start
-                time.sleep(0.1)
+                self.wait_for_state(PlayerState.PLAYING, timeout=0.1)
                 
                 # NOW publish state (after playback started)
                 self.check_and_publish_state_changes()
                 
                 # Wait for playback to finish (or pause)
-                while self.state == PlayerState.PLAYING:
+                while self._wait_while_state(PlayerState.PLAYING):
                     if self.repeat_cancel_event.is_set():
                         print(f"\r[REPEAT] Cancelled during playback")
                         with self.repeat_params_lock:
@@ -1131,11 +1500,9 @@ class AudioPlayer:
                             self.repeat_enabled = False
                         print(f"\r[REPEAT] Loop enabled - handing over to loop mode")
                         return
-                    
-                    time.sleep(0.1)
                 
                 # Check if paused (wait for resume or cancellation)
-                while self.state == PlayerState.PAUSED:
+                while self._wait_while_state(PlayerState.PAUSED):
                     if self.repeat_cancel_event.is_set():
                         print(f"\r[REPEAT] Cancelled while paused")
                         with self.repeat_params_lock:
@@ -1148,15 +1515,15 @@ class AudioPlayer:
                             self.repeat_enabled = False
                         print(f"\r[REPEAT] Loop enabled while paused - handing over to loop mode")
                         return
-                    
-                    time.sleep(0.1)
                 
-                print(f"\r[REPEAT] Play {self.repeat_current}/{self.repeat_count} finished")
+                if REPEAT_DEBUG:
+                    print(f"\r[REPEAT] Play {self.repeat_current}/{self.repeat_count} finished")
                 
                 # If not the last iteration, wait interval before next play
                 if i < self.repeat_count - 1:
                     if self.repeat_interval > 0:
-                        print(f"\r[REPEAT] Waiting {self.repeat_interval}s before next play (position: 00:00)")
+                        if REPEAT_DEBUG:
+                            print(f"\r[REPEAT] Waiting {self.repeat_interval}s before next play (position: 00:00)")
                         
                         # Reset position to 00:00 during wait
                         self.position = 0
@@ -1191,49 +1558,56 @@ class AudioPlayer:
         Returns:
             dict: Health status with keys 'is_healthy', 'issues', and 'metrics'
         """
-        # CRITICAL: Define health dict at the very start
+        # CRITICAL: Define health dict at the very start.
+        # A fresh dict per call, so callers can keep or publish it as is.
+        metrics = {}
         health = {
             'is_healthy': True,
             'issues': [],
-            'metrics': {}
+            'metrics': metrics
         }
         
+        # One snapshot of the fields the audio callback writes, so every check
+        # below sees the same state/position pair
+        state = self.state
+        position = self.position
+        
         # Not playing is not an error
-        if self.state != PlayerState.PLAYING:
-            health['metrics']['state'] = self.state.value
+        if state != PlayerState.PLAYING:
+            metrics['state'] = state.value
             # During repeat intervals, audio is legitimately stopped
-            if self.repeat_enabled and self.state == PlayerState.STOPPED:
-                health['metrics']['repeat_waiting'] = True
+            if self.repeat_enabled and state == PlayerState.STOPPED:
+                metrics['repeat_waiting'] = True
             return health  # <-- Return the dict
         
-        current_time = time.time()
-        time_since_update = current_time - self.playback_health['last_position_update']
+        current_time = time.monotonic_ns()
+        time_since_update = (current_time - self.playback_health.last_position_update) / 1e9
         
         try:
             # Check if position is advancing
-            if self.position > 0:
-                self.playback_health['last_position_update'] = current_time
+            if position > 0:
+                self.playback_health.last_position_update = current_time
             
             # Check for stall (position not advancing for too long)
-            if time_since_update > self.playback_health['position_check_interval']:
+            if time_since_update > self.playback_health.position_check_interval:
                 health['is_healthy'] = False
                 health['issues'].append(f'position_stalled_{time_since_update:.1f}s')
             
             # Check callback error rate
-            if self.playback_health['callback_calls'] > 0:
-                error_rate = self.playback_health['callback_errors'] / self.playback_health['callback_calls']
-                if error_rate > 0.01:  # More than 1% errors
-                    health['is_healthy'] = False
-                    health['issues'].append(f'high_error_rate_{error_rate:.2%}')
+            callback_calls = self._callback_calls
+            callback_errors = self._callback_errors
+            # More than 1% errors (integer compare; the rate is only needed for the message)
+            if callback_errors * 100 > callback_calls:
+                error_rate = callback_errors / callback_calls
+                health['is_healthy'] = False
+                health['issues'].append(f'high_error_rate_{error_rate:.2%}')
             
             # Add metrics
-            health['metrics'] = {
-                'callback_calls': self.playback_health['callback_calls'],
-                'callback_errors': self.playback_health['callback_errors'],
-                'time_since_update': round(time_since_update, 2),
-                'position': self.position,
-                'audio_length': self.audio_length
-            }
+            metrics['callback_calls'] = callback_calls
+            metrics['callback_errors'] = callback_errors
+            metrics['time_since_update'] = round(time_since_update, 2)
+            metrics['position'] = position
+            metrics['audio_length'] = self.audio_length
             
         except Exception as e:
             health['is_healthy'] = False
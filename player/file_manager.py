@@ -3,11 +3,19 @@ File manager for audio player - handles file downloads and management.
 """
 
 import os
+import shutil
 import time
 import urllib.parse
+from pathlib import Path
+
 import requests
 from colorama import Fore, Style
 
+from player.utils import is_valid_audio_file
+
+# Bytes copied per read/write when saving a download
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
 
 class DownloadState:
     DOWNLOADING = "downloading"
@@ -20,10 +28,50 @@ class AudioFileManager:
     def __init__(self, audio_dir, auto_start_enabled=False):
         self.audio_dir = audio_dir
         self.auto_start_enabled = auto_start_enabled
-        self.current_file = None
-        self.previous_file = None
+        self._current_file = None
+        self._current_file_basename = None
+        self._previous_file = None
+        self._previous_file_basename = None
         self.was_playing = True
 
+        # Reused across downloads so repeat fetches from the same server keep
+        # their TCP/TLS connection alive
+        self._session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=4)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+    @property
+    def current_file(self):
+        """Full path of the current audio file"""
+        return self._current_file
+
+    @current_file.setter
+    def current_file(self, file_path):
+        # Basename is cached here; it's read on every position publish
+        self._current_file = file_path
+        self._current_file_basename = os.path.basename(file_path) if file_path else None
+
+    @property
+    def current_file_basename(self):
+        """File name of the current audio file (None if no file)"""
+        return self._current_file_basename
+
+    @property
+    def previous_file(self):
+        """Full path of the file played before the current one"""
+        return self._previous_file
+
+    @previous_file.setter
+    def previous_file(self, file_path):
+        self._previous_file = file_path
+        self._previous_file_basename = os.path.basename(file_path) if file_path else None
+
+    @property
+    def previous_file_basename(self):
+        """File name of the previous audio file (None if no file)"""
+        return self._previous_file_basename
+
     def set_current_file(self, file_path):
         """Set the current audio file"""
         self.previous_file = self.current_file
@@ -33,9 +81,6 @@ class AudioFileManager:
         """Load audio file from absolute path on the same computer"""
         try:
             # Convert to Path object for cross-platform compatibility
-            from pathlib import Path
-            from player.utils import is_valid_audio_file
-            
             audio_file_path = Path(file_path)
             
             # Validate file exists
@@ -114,9 +159,11 @@ class AudioFileManager:
             self.was_playing = player.state.value == "playing"
             
             # Save repeat parameters if repeat is active
-            repeat_was_active = player.repeat_enabled
-            saved_repeat_count = player.repeat_count if repeat_was_active else 0
-            saved_repeat_interval = player.repeat_interval if repeat_was_active else 0.0
+            repeat_was_active, saved_repeat_count, saved_repeat_interval = (
+                player.snapshot_repeat()
+            )
+            if not repeat_was_active:
+                saved_repeat_count, saved_repeat_interval = 0, 0.0
             
             if repeat_was_active:
                 print(f"\r[DOWNLOAD] Saving repeat params: {saved_repeat_count}x with {saved_repeat_interval}s interval")
@@ -139,11 +186,7 @@ class AudioFileManager:
                     DownloadState.DOWNLOADING,
                     {
                         "download_url": url,
-                        "current_file": (
-                            os.path.basename(self.current_file)
-                            if self.current_file
-                            else None
-                        ),
+                        "current_file": self.current_file_basename,
                     },
                 )
 
@@ -166,13 +209,15 @@ class AudioFileManager:
                 f"\r[DOWNLOAD] {Fore.LIGHTYELLOW_EX}Downloading to{Style.RESET_ALL}: "
                 f"{filename} (audio continues playing)"
             )
-            response = requests.get(url, stream=True, timeout=30)
-            response.raise_for_status()
+            # Closing the response hands the connection back to the session pool
+            with self._session.get(url, stream=True, timeout=30) as response:
+                response.raise_for_status()
 
-            # Save file
-            with open(download_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+                # Save file: large-block copy straight from the socket stream
+                # (decode_content keeps gzip/deflate transfer encodings handled)
+                response.raw.decode_content = True
+                with open(download_path, "wb") as f:
+                    shutil.copyfileobj(response.raw, f, length=DOWNLOAD_CHUNK_SIZE)
 
             print(
                 f"\r[DOWNLOAD] {Fore.LIGHTGREEN_EX}Download completed{Style.RESET_ALL}: "
@@ -219,11 +264,7 @@ class AudioFileManager:
                         {
                             "downloaded_file": filename,
                             "file_path": download_path,
-                            "previous_file": (
-                                os.path.basename(self.previous_file)
-                                if self.previous_file
-                                else None
-                            ),
+                            "previous_file": self.previous_file_basename,
                             "original_state": original_state.value,
                             "auto_started": should_auto_start,
                             "repeat_restarted": repeat_was_active,
@@ -257,11 +298,7 @@ class AudioFileManager:
                             if "original_state" in locals()
                             else "unknown"
                         ),
-                        "current_file": (
-                            os.path.basename(self.current_file)
-                            if self.current_file
-                            else None
-                        ),
+                        "current_file": self.current_file_basename,
                         "playback_interrupted": False,
                     },
                 )
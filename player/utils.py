@@ -3,57 +3,94 @@ Audio utilities for device discovery and file management.
 """
 
 import os
-import glob
 import sounddevice as sd
 from colorama import Fore, Style
 
 
-def find_device_by_name(device_name):
-    """Find a device by its name and return its index, preferring output devices."""
-    devices = sd.query_devices()
+# sd.query_devices() result and name -> index maps built from it.
+# Each query re-enumerates every host API in PortAudio, so it's done once.
+_device_cache = None
+_output_index_by_name = {}
+_any_index_by_name = {}
+
 
-    # First pass: exact match among OUTPUT devices only
-    for device in devices:
-        if device["name"] == device_name and device["max_output_channels"] > 0:
-            return device["index"]  # ← Correct device index
+# Pre-formatted pieces of the device listing
+_DEFAULT_MARKER = f" {Fore.GREEN}(DEFAULT){Style.RESET_ALL}"
+_DEVICES_HEADER = f"\n{Fore.CYAN}Available Audio Output Devices:{Style.RESET_ALL}"
+_DEVICES_SEPARATOR = f"{Fore.CYAN}" + "-" * 50 + f"{Style.RESET_ALL}"
 
-    # Fallback
-    for device in devices:
-        if device["name"] == device_name:
-            return device["index"]
 
-    return None
+def get_devices():
+    """Return sd.query_devices(), queried on first use and cached after that."""
+    global _device_cache
+    if _device_cache is None:
+        devices = sd.query_devices()
+        output_index, any_index = {}, {}
+        for device in devices:
+            # First device with a given name wins, like a front-to-back scan
+            if device["max_output_channels"] > 0:
+                output_index.setdefault(device["name"], device["index"])
+            any_index.setdefault(device["name"], device["index"])
+        _output_index_by_name.clear()
+        _output_index_by_name.update(output_index)
+        _any_index_by_name.clear()
+        _any_index_by_name.update(any_index)
+        _device_cache = devices
+    return _device_cache
 
 
-def list_available_devices():
-    """List all available audio output devices with details."""
-    devices = sd.query_devices()
+def invalidate_device_cache():
+    """Forget the cached device list (e.g. after devices were plugged in)."""
+    global _device_cache
+    _device_cache = None
+
+
+def find_device_by_name(device_name):
+    """Find a device by its name and return its index, preferring output devices."""
+    get_devices()
+
+    # Exact match among OUTPUT devices first, then any device
+    index = _output_index_by_name.get(device_name)
+    if index is None:
+        index = _any_index_by_name.get(device_name)
+    return index
+
+
+def list_available_devices(devices=None):
+    """
+    List all available audio output devices with details.
+    Args:
+        devices: Result of sd.query_devices() if already queried (e.g. in a
+                 background thread), otherwise the cached device list is used.
+    """
+    if devices is None:
+        devices = get_devices()
     output_devices = []
+    # Each sd.default.device read goes through sounddevice/PortAudio, read it once
+    default_out = sd.default.device[1]
 
-    print(f"\n{Fore.CYAN}Available Audio Output Devices:{Style.RESET_ALL}")
-    print(f"{Fore.CYAN}" + "-" * 50 + f"{Style.RESET_ALL}")
+    # Built up and printed in one go (one write/flush instead of four per device)
+    lines = [_DEVICES_HEADER, _DEVICES_SEPARATOR]
 
     for i, device in enumerate(devices):
         # Only consider output devices
         if device["max_output_channels"] > 0:
-            is_default = i == sd.default.device[1]
-            default_marker = (
-                f" {Fore.GREEN}(DEFAULT){Style.RESET_ALL}" if is_default else ""
-            )
+            default_marker = _DEFAULT_MARKER if i == default_out else ""
 
-            print(
+            lines.append(
                 f"{Fore.YELLOW}Device {i}: {device['name']}{default_marker}{Style.RESET_ALL}"
             )
-            print(f"  Channels: {device['max_output_channels']} out")
-            print(f"  Sample Rate: {device['default_samplerate']} Hz")
-            print(
+            lines.append(f"  Channels: {device['max_output_channels']} out")
+            lines.append(f"  Sample Rate: {device['default_samplerate']} Hz")
+            lines.append(
                 f"  Device type: {'Input' if device['max_input_channels'] > 0 else ''}"
                 f"{' & ' if device['max_input_channels'] > 0 and device['max_output_channels'] > 0 else ''}"
                 f"{'Output' if device['max_output_channels'] > 0 else ''}"
             )
             output_devices.append(i)
 
-    print(f"{Fore.CYAN}" + "-" * 50 + f"{Style.RESET_ALL}")
+    lines.append(_DEVICES_SEPARATOR)
+    print("\n".join(lines))
     return output_devices
 
 
@@ -66,28 +103,30 @@ def confirm_selected_device(device=None, target_channels=2, channel_mapping=None
     if channel_mapping is None:
         channel_mapping = [1] * target_channels
 
+    default_out = sd.default.device[1]
+
     # ** Get device index & convert to name, if necessary
     if device is None:
-        device_index = sd.default.device[1]
+        device_index = default_out
     elif isinstance(device, str):
         device_index = find_device_by_name(device)
         if device_index is None:
             print(f"Device '{device}' not found. Using default.")
-            device_index = sd.default.device[1]
+            device_index = default_out
     else:
         device_index = device
 
     # Validate device exists and is an output device
-    all_devices = sd.query_devices()
+    all_devices = get_devices()
     if device_index >= len(all_devices):
         print(f"Device index {device_index} out of range. Using default.")
-        device_index = sd.default.device[1]
+        device_index = default_out
     elif all_devices[device_index]["max_output_channels"] == 0:
         print(f"Device {device_index} is not an output device. Using default.")
-        device_index = sd.default.device[1]
+        device_index = default_out
 
     # Get device info
-    device_info = sd.query_devices(device_index)
+    device_info = all_devices[device_index]
 
     # Check channel compatibility
     available_channels = device_info["max_output_channels"]
@@ -104,46 +143,63 @@ def confirm_selected_device(device=None, target_channels=2, channel_mapping=None
     return device_info, device_index, target_channels, channel_mapping
 
 
-def is_valid_audio_file(filepath):
-    """Check if a file is a valid audio file (not a macOS metadata file)."""
-    filename = os.path.basename(filepath)
+# Project root (parent of this package); audio dirs are resolved against it
+_PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
-    # Filter out macOS metadata files and other system files
-    if filename.startswith("._"):
-        return False
-    if filename.startswith(".DS_Store"):
-        return False
-    if filename.startswith("Thumbs.db"):  # Windows thumbnail cache
-        return False
+# macOS metadata files and other system files ("Thumbs.db" is the Windows thumbnail cache)
+_SYSTEM_FILE_PREFIXES = ("._", ".DS_Store", "Thumbs.db")
+
+# WAV container magic: bytes 0-4 (RIFF, big-endian RIFX or 64-bit RF64) and 8-12
+_WAV_RIFF_IDS = (b"RIFF", b"RIFX", b"RF64")
+_WAV_FORMAT_ID = b"WAVE"
 
-    # Check file size (metadata files are usually very small)
+
+def _has_wav_header(filepath):
+    """Check the 12-byte RIFF/WAVE header (metadata files and junk don't have one)."""
     try:
-        file_size = os.path.getsize(filepath)
-        if file_size < 1000:  # Less than 1KB is likely not a real audio file
-            return False
+        with open(filepath, "rb") as f:
+            head = f.read(12)
     except OSError:
         return False
+    return head[:4] in _WAV_RIFF_IDS and head[8:12] == _WAV_FORMAT_ID
+
+
+def is_valid_audio_file(filepath):
+    """Check if a file is a valid audio file (not a macOS metadata file)."""
+    if os.path.basename(filepath).startswith(_SYSTEM_FILE_PREFIXES):
+        return False
+    return _has_wav_header(filepath)
 
-    return True
+
+def _is_valid_audio_entry(entry):
+    """is_valid_audio_file for an os.scandir entry."""
+    if entry.name.startswith(_SYSTEM_FILE_PREFIXES):
+        return False
+    return _has_wav_header(entry.path)
 
 
 def find_audio_files(input_dir):
     """Find available audio files in the specified directory."""
     wav_files = None
     audio_file_exists = False
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    parent_dir = os.path.dirname(script_dir)
-    input_audio_file_dir = os.path.join(parent_dir, input_dir)
+    input_audio_file_dir = os.path.join(_PROJECT_DIR, input_dir)
 
     if os.path.exists(input_audio_file_dir):
         print(
             f"{Fore.LIGHTGREEN_EX}Input directory exists:{Style.RESET_ALL} {input_audio_file_dir}"
         )
-        # Get all .wav files
-        all_wav_files = glob.glob(os.path.join(input_audio_file_dir, "*.wav"))
-
-        # Filter out invalid files (macOS metadata, etc.)
-        wav_files = [f for f in all_wav_files if is_valid_audio_file(f)]
+        # Get all .wav files in one directory pass, filtering out invalid
+        # files (macOS metadata, etc.) as we go
+        wav_files = []
+        ignored_files = []
+        with os.scandir(input_audio_file_dir) as entries:
+            for entry in entries:
+                if not entry.name.lower().endswith(".wav") or not entry.is_file():
+                    continue
+                if _is_valid_audio_entry(entry):
+                    wav_files.append(entry.path)
+                else:
+                    ignored_files.append(entry.path)
 
         if wav_files:
             audio_file_exists = True
@@ -153,7 +209,6 @@ def find_audio_files(input_dir):
                 print(f"  - {os.path.basename(wav_file)}")
 
             # If we filtered out files, show what was ignored
-            ignored_files = [f for f in all_wav_files if not is_valid_audio_file(f)]
             if ignored_files:
                 print(
                     f"{Fore.YELLOW}Ignored {len(ignored_files)} invalid file(s):{Style.RESET_ALL}"
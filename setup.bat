@@ -29,6 +29,7 @@ if exist dist rmdir /s /q dist >nul 2>nul
 if exist *.egg-info rmdir /s /q *.egg-info >nul 2>nul
 if exist *.spec del *.spec >nul 2>nul
 if exist audio-player.exe del audio-player.exe >nul 2>nul
+if exist audio-player rmdir /s /q audio-player >nul 2>nul
 
 uv sync
 if %ERRORLEVEL% NEQ 0 (
@@ -64,8 +65,8 @@ uv run build.py
 if %ERRORLEVEL% EQU 0 (
     echo [INFO] Build complete! Ready to run...
     echo.
-    echo Your executable is ready: .\audio-player.exe
-    echo Run it with: .\audio-player.exe
+    echo Your executable is ready: .\audio-player\audio-player.exe
+    echo Run it with: .\audio-player\audio-player.exe
     echo.
     if exist build rmdir /s /q build >nul 2>nul
     if exist dist rmdir /s /q dist >nul 2>nul
@@ -84,7 +85,7 @@ echo ===== Usage Instructions =====
 echo.
 echo Development:  uv run main.py
 echo Build binary: uv run build.py
-echo Run binary:   .\audio-player.exe
+echo Run binary:   .\audio-player\audio-player.exe
 echo.
 echo Config: Edit config.yaml ^| Place .wav files in audio\
 echo Done! 🎵
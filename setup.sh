@@ -57,8 +57,8 @@ case $choice in
         if uv run build.py; then
             print_info "Build complete! Ready to run..."
             rm -rf build dist *.egg-info *.spec 2>/dev/null
-            echo -e "\n${BLUE}Your executable is ready:${NC} ./audio-player"
-            echo -e "${YELLOW}Run it with:${NC} ./audio-player"
+            echo -e "\n${BLUE}Your executable is ready:${NC} ./audio-player/audio-player"
+            echo -e "${YELLOW}Run it with:${NC} ./audio-player/audio-player"
         else
             print_error "Build failed"
             exit 1
@@ -72,6 +72,6 @@ esac
 echo -e "\n${GREEN}Usage:${NC}"
 echo -e "  ${BLUE}Development:${NC} uv run main.py"
 echo -e "  ${BLUE}Build binary:${NC} uv run build.py"
-echo -e "  ${BLUE}Run binary:${NC} ./audio-player"
+echo -e "  ${BLUE}Run binary:${NC} ./audio-player/audio-player"
 echo -e "\n${GREEN}Config:${NC} Edit config.yaml | Place .wav files in audio/"
 echo -e "${GREEN}Done! 🎵${NC}\n"
\ No newline at end of file
@@ -9,25 +9,66 @@ It only shows output devices and guides the user through the configuration proce
 import sounddevice as sd
 import yaml
 import sys
-import copy
+import os
+import codecs
+import shutil
 import subprocess
 from pathlib import Path
 
-# Try to import colorama for colored output
+# Prefer libyaml's C loader/dumper, fall back to the pure-Python ones if unavailable
 try:
-    from colorama import Fore, Style, init
-    init(autoreset=True)
-    color_support = True
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
 except ImportError:
-    # Create dummy color class if colorama isn't available
-    class DummyColor:
-        def __getattr__(self, name):
-            return ""
+    from yaml import SafeLoader, SafeDumper
+
+# Dummy color class for when colorama isn't available or output isn't a terminal
+class DummyColor:
+    def __getattr__(self, name):
+        return ""
+
+
+# Try to import colorama for colored output (only when writing to a terminal,
+# so pipes and log files get plain text and no colorama stdout wrapper)
+if sys.stdout.isatty():
+    try:
+        from colorama import Fore, Style, init
+        init(autoreset=True)
+        color_support = True
+    except ImportError:
+        Fore = DummyColor()
+        Style = DummyColor()
+        color_support = False
+else:
     Fore = DummyColor()
     Style = DummyColor()
     color_support = False
 
 
+# The script's directory; the config file is one level up
+_SCRIPT_DIR = Path(__file__).resolve().parent
+_CONFIG_PATH = _SCRIPT_DIR.parent / "config.yaml"
+_TEST_SCRIPT = _SCRIPT_DIR / "02_test_sound_device.py"
+
+
+# Player fields compared in the configuration summary
+_SUMMARY_FIELDS = ('device_name', 'device_sample_rate', 'device_channels', 'playback_channel_mask')
+
+
+class _ConfigDumper(SafeDumper):
+    """Dumper for config.yaml (list style registered here, not on yaml globally)"""
+
+
+def _represent_list(dumper, data):
+    """Use a custom representor to format lists in flow style"""
+    # Check if this is the channel mask (contains only 0s and 1s)
+    if all(isinstance(x, int) and x in [0, 1] for x in data):
+        return dumper.represent_sequence('tag:yaml.org,2002:seq', data, flow_style=True)
+    return dumper.represent_sequence('tag:yaml.org,2002:seq', data, flow_style=False)
+
+
+_ConfigDumper.add_representer(list, _represent_list)
+
+
 def print_header(title, width=80):
     """Print a formatted header"""
     print(f"\n{Fore.CYAN}{Style.BRIGHT}" + "=" * width + Style.RESET_ALL)
@@ -46,9 +87,9 @@ def get_output_devices():
     devices = sd.query_devices()
     output_devices = []
     
+    # sd.default.device already holds the default indices, no second device scan needed
     try:
-        default_output = sd.query_devices(kind="output")
-        default_index = default_output['index']
+        default_index = sd.default.device[1]
     except Exception:
         default_index = None
     
@@ -61,7 +102,8 @@ def get_output_devices():
                 'channels': device['max_output_channels'],
                 'sample_rate': int(device['default_samplerate']),
                 'is_default': is_default,
-                'device_info': device
+                'low_latency': device['default_low_output_latency'],
+                'high_latency': device['default_high_output_latency']
             })
     
     return output_devices
@@ -71,18 +113,18 @@ def display_output_devices(output_devices):
     """Display all output devices in a formatted way"""
     print_section("Available Audio Output Devices")
     
+    # Collected and printed once instead of several prints per device
+    lines = []
     for device in output_devices:
         default_marker = f" {Fore.GREEN}(DEFAULT){Style.RESET_ALL}" if device['is_default'] else ""
         
-        print(f"\n{Fore.BLUE}{Style.BRIGHT}Device {device['index']}: {Fore.WHITE}{device['name']}{Style.RESET_ALL}{default_marker}")
-        print(f"  Channels:     {Fore.GREEN}{device['channels']}{Style.RESET_ALL} out")
-        print(f"  Sample Rate:  {Fore.GREEN}{device['sample_rate']} Hz{Style.RESET_ALL}")
+        lines.append(f"\n{Fore.BLUE}{Style.BRIGHT}Device {device['index']}: {Fore.WHITE}{device['name']}{Style.RESET_ALL}{default_marker}")
+        lines.append(f"  Channels:     {Fore.GREEN}{device['channels']}{Style.RESET_ALL} out")
+        lines.append(f"  Sample Rate:  {Fore.GREEN}{device['sample_rate']} Hz{Style.RESET_ALL}")
         
-        # Show latency info if available
-        device_info = device['device_info']
-        if device_info['max_output_channels'] > 0:
-            print(f"  Output Latency: {Fore.GREEN}{device_info['default_low_output_latency'] * 1000:.2f}{Style.RESET_ALL} ms (low), "
-                  f"{Fore.GREEN}{device_info['default_high_output_latency'] * 1000:.2f}{Style.RESET_ALL} ms (high)")
+        lines.append(f"  Output Latency: {Fore.GREEN}{device['low_latency'] * 1000:.2f}{Style.RESET_ALL} ms (low), "
+                     f"{Fore.GREEN}{device['high_latency'] * 1000:.2f}{Style.RESET_ALL} ms (high)")
+    print("\n".join(lines))
 
 
 def get_yes_no_input(prompt, default=None):
@@ -162,10 +204,7 @@ def configure_channel_mask(total_channels):
 
 def load_config():
     """Load current configuration from config.yaml"""
-    # config_path = Path("config.yaml")
-     # Get the script's directory and go one level up where the config file is ...
-    script_dir = Path(__file__).parent
-    config_path = script_dir.parent / "config.yaml"
+    config_path = _CONFIG_PATH
     
     if not config_path.exists():
         print(f"{Fore.RED}Error: config.yaml not found in current directory.{Style.RESET_ALL}")
@@ -174,7 +213,7 @@ def load_config():
     
     try:
         with open(config_path, 'r') as file:
-            config = yaml.safe_load(file)
+            config = yaml.load(file, Loader=SafeLoader)
         return config
     except Exception as e:
         print(f"{Fore.RED}Error loading config.yaml: {e}{Style.RESET_ALL}")
@@ -183,30 +222,23 @@ def load_config():
 
 def save_config(config):
     """Save updated configuration to config.yaml"""
-    # config_path = Path("config.yaml")
-    # Get the script's directory and go one level up where the config file is ...
-    script_dir = Path(__file__).parent
-    config_path = script_dir.parent / "config.yaml"
+    config_path = _CONFIG_PATH
     
     try:
         # Create backup
         backup_path = config_path.with_suffix('.yaml.backup')
         if config_path.exists():
-            with open(config_path, 'r') as src, open(backup_path, 'w') as dst:
-                dst.write(src.read())
+            # Kernel-side copy (sendfile/CopyFileEx), no read into Python
+            shutil.copyfile(config_path, backup_path)
             print(f"{Fore.GREEN}Backup created: {backup_path}{Style.RESET_ALL}")
         
-        # Save new config with custom formatting for channel mask
-        with open(config_path, 'w') as file:
-            # Use a custom representor to format lists in flow style
-            def represent_list(dumper, data):
-                # Check if this is the channel mask (contains only 0s and 1s)
-                if all(isinstance(x, int) and x in [0, 1] for x in data):
-                    return dumper.represent_sequence('tag:yaml.org,2002:seq', data, flow_style=True)
-                return dumper.represent_sequence('tag:yaml.org,2002:seq', data, flow_style=False)
-            
-            yaml.add_representer(list, represent_list)
-            yaml.dump(config, file, default_flow_style=False, indent=2)
+        # Save new config with custom formatting for channel mask.
+        # Written next to it and renamed over it, so a failed dump never
+        # leaves a truncated config.yaml behind
+        tmp_path = config_path.with_suffix('.yaml.tmp')
+        with open(tmp_path, 'w') as file:
+            yaml.dump(config, file, Dumper=_ConfigDumper, default_flow_style=False, indent=2)
+        os.replace(tmp_path, config_path)
         
         print(f"{Fore.GREEN}Configuration saved successfully to {config_path}{Style.RESET_ALL}")
         
@@ -215,31 +247,31 @@ def save_config(config):
         sys.exit(1)
 
 
-def display_configuration_summary(old_config, new_config):
+def snapshot_player_fields(config):
+    """
+    Copy of the player fields the summary compares. The configurator replaces
+    these values rather than mutating them, so a shallow copy is enough.
+    """
+    player = config.get('player', {})
+    return {field: player.get(field, 'Not set') for field in _SUMMARY_FIELDS}
+
+
+def display_configuration_summary(old_player, new_config):
     """Display summary of configuration changes"""
     print_section("Configuration Summary")
     
-    old_player = old_config.get('player', {})
     new_player = new_config.get('player', {})
+    new_fields = snapshot_player_fields(new_config)
     
-    changes = []
-    
-    # Check each field for changes
-    fields_to_check = ['device_name', 'device_sample_rate', 'device_channels', 'playback_channel_mask']
+    # Both snapshots hold every summary field, so one lookup per side
+    changed = [field for field in _SUMMARY_FIELDS if old_player[field] != new_fields[field]]
     
-    for field in fields_to_check:
-        old_value = old_player.get(field, 'Not set')
-        new_value = new_player.get(field, 'Not set')
-        
-        if old_value != new_value:
-            changes.append((field, old_value, new_value))
-    
-    if changes:
+    if changed:
         print(f"\n{Fore.GREEN}The following changes will be made:{Style.RESET_ALL}")
-        for field, old_val, new_val in changes:
+        for field in changed:
             print(f"  {Fore.YELLOW}{field}:{Style.RESET_ALL}")
-            print(f"    Old: {Fore.RED}{old_val}{Style.RESET_ALL}")
-            print(f"    New: {Fore.GREEN}{new_val}{Style.RESET_ALL}")
+            print(f"    Old: {Fore.RED}{old_player[field]}{Style.RESET_ALL}")
+            print(f"    New: {Fore.GREEN}{new_fields[field]}{Style.RESET_ALL}")
     else:
         print(f"\n{Fore.YELLOW}No changes detected.{Style.RESET_ALL}")
     
@@ -252,8 +284,7 @@ def display_configuration_summary(old_config, new_config):
 
 def run_test_script():
     """Run the audio device test script and display its output"""
-    script_dir = Path(__file__).parent
-    test_script = script_dir / "02_test_sound_device.py"
+    test_script = _TEST_SCRIPT
     
     # Check if the test script exists
     if not Path(test_script).exists():
@@ -270,13 +301,29 @@ def run_test_script():
             [sys.executable, test_script],
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            universal_newlines=True,
-            bufsize=1
+            bufsize=0
         )
         
-        # Print output line by line as it comes
-        for line in process.stdout:
-            print(line, end='')
+        # Pass output bytes through as they come (no per-line decode/encode).
+        # On Windows the text goes through sys.stdout instead, so colorama can
+        # still translate the child's ANSI color codes for the console.
+        # Flush first so our own prints above come out before the child's output.
+        sys.stdout.flush()
+        out = getattr(sys.stdout, 'buffer', None) if os.name != 'nt' else None
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        fd = process.stdout.fileno()
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            if out is not None:
+                out.write(chunk)
+                out.flush()
+            else:
+                sys.stdout.write(decoder.decode(chunk))
+                sys.stdout.flush()
+        if out is None:
+            sys.stdout.write(decoder.decode(b'', final=True))
         
         # Wait for the process to complete
         return_code = process.wait()
@@ -328,7 +375,7 @@ def main():
         # Load current configuration
         print(f"\n{Fore.CYAN}Loading current configuration...{Style.RESET_ALL}")
         config = load_config()
-        old_config = copy.deepcopy(config)  # Use deep copy to avoid reference issues
+        old_player = snapshot_player_fields(config)
         
         # Get device selection
         print(f"\n{Fore.YELLOW}Step 1: Select Audio Device{Style.RESET_ALL}")
@@ -357,7 +404,7 @@ def main():
         config['player']['playback_channel_mask'] = channel_mask
         
         # Display summary
-        display_configuration_summary(old_config, config)
+        display_configuration_summary(old_player, config)
         
         # Confirm changes
         confirm = get_yes_no_input(f"\n{Fore.YELLOW}Save these changes to config.yaml?{Style.RESET_ALL}")
@@ -14,11 +14,21 @@
 # -------------- #
 import os
 import sys
+import math
+import atexit
+import threading
+from collections import deque
 from pathlib import Path
 import yaml
 from jinja2 import Template
 from colorama import Fore, Style
 
+# Prefer libyaml's C parser, fall back to the pure-Python one if unavailable
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 # ----------------------------- #
 # -- Main playback ctrl libs -- #
 # ----------------------------- #
@@ -38,16 +48,30 @@ config_path = project_root / "config.yaml"
 with open(config_path, "r") as file:
     config_str = file.read()
 
-config_unrendered = yaml.safe_load(config_str)
+config_unrendered = yaml.load(config_str, Loader=SafeLoader)
 
 logging_config = config_unrendered["logging"]
 paths_config = config_unrendered["paths"]
 player_config = config_unrendered["player"]
 
-# Use Jinja2 to process the template for MQTT info
-mqtt_template = Template(config_str)
-rendered_mqtt_info = mqtt_template.render(mqtt=config_unrendered["mqtt"])
-mqtt_config = yaml.safe_load(rendered_mqtt_info)
+# Use Jinja2 to process the template for MQTT info.
+# Only the mqtt section is templated, and only the strings carrying
+# template markers go through Jinja (no re-render/re-parse of the file)
+def _render_templated_values(value, mqtt):
+    if isinstance(value, dict):
+        return {k: _render_templated_values(v, mqtt) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_render_templated_values(v, mqtt) for v in value]
+    if isinstance(value, str) and ("{{" in value or "{%" in value):
+        return Template(value).render(mqtt=mqtt)
+    return value
+
+
+mqtt_unrendered = config_unrendered["mqtt"]
+if "{{" in config_str or "{%" in config_str:
+    mqtt_config = _render_templated_values(mqtt_unrendered, mqtt_unrendered)
+else:
+    mqtt_config = mqtt_unrendered
 
 
 # --------------------------- #
@@ -72,6 +96,9 @@ TARGET_VOLUME_FACTOR = player_config["playback_volume_factor"]
 TARGET_TOTAL_CHANNELS = player_config["device_channels"]
 # TARGET_CHANNEL_MASK = [0, 1]  # Default: enable both 1 channel
 TARGET_CHANNEL_MASK = player_config["playback_channel_mask"]
+# Stream buffering, same keys and defaults as the player (0 = let PortAudio choose)
+TARGET_BLOCKSIZE = int(player_config.get("stream_blocksize", 1024))
+TARGET_LATENCY = player_config.get("stream_latency", "high")
 
 # --> Audio file path stuff <-- #
 # AUDIO_DIR = "audio"
@@ -84,22 +111,25 @@ INPUT_AUDIO_FILE_DIR = project_root / AUDIO_DIR
 
 
 def is_valid_audio_file(filepath):
-    """Check if a file is a valid audio file (not a macOS metadata file)."""
-    filename = os.path.basename(str(filepath))
+    """
+    Check if a file is a valid audio file (not a macOS metadata file).
+    Accepts a path or an os.DirEntry (whose stat result is cached).
+    """
+    if isinstance(filepath, os.DirEntry):
+        filename = filepath.name
+    else:
+        filename = os.path.basename(str(filepath))
 
     # Filter out macOS metadata files and other system files
-    if filename.startswith("._"):
-        return False
-    if filename.startswith(".DS_Store"):
-        return False
-    if filename.startswith("Thumbs.db"):  # Windows thumbnail cache
+    # ("Thumbs.db" is the Windows thumbnail cache)
+    if filename.startswith(("._", ".DS_Store", "Thumbs.db")):
         return False
 
     # Check file size (metadata files are usually very small)
     try:
         file_size = (
             filepath.stat().st_size
-            if isinstance(filepath, Path)
+            if isinstance(filepath, (Path, os.DirEntry))
             else os.path.getsize(filepath)
         )
         if file_size < 1000:  # Less than 1KB is likely not a real audio file
@@ -120,14 +150,16 @@ if INPUT_AUDIO_FILE_DIR.exists():
     print(
         f"{Fore.LIGHTGREEN_EX}Input directory exists:{Style.RESET_ALL} {INPUT_AUDIO_FILE_DIR}"
     )
-    # Check for .wav files in the directory
-    all_wav_files = list(INPUT_AUDIO_FILE_DIR.glob("*.wav"))
-
-    # Filter out invalid files (macOS metadata, etc.)
-    valid_wav_files = [f for f in all_wav_files if is_valid_audio_file(f)]
-
-    # Convert Path objects to strings if needed for compatibility
-    wav_files = [str(f) for f in valid_wav_files]
+    # Check for .wav files in the directory, filtering out invalid files
+    # (macOS metadata, etc.) in the same directory pass
+    wav_files, ignored_files = [], []
+    with os.scandir(INPUT_AUDIO_FILE_DIR) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".wav") or not entry.is_file():
+                continue
+            (wav_files if is_valid_audio_file(entry) else ignored_files).append(
+                entry.path
+            )
 
     if wav_files:
         audio_file_exists = True
@@ -137,14 +169,13 @@ if INPUT_AUDIO_FILE_DIR.exists():
             print(f"  - {os.path.basename(wav_file)}")
 
         # If we filtered out files, show what was ignored
-        ignored_files = [f for f in all_wav_files if not is_valid_audio_file(f)]
         if ignored_files:
             print(
                 f"{Fore.YELLOW}Ignored {len(ignored_files)} invalid file(s):{Style.RESET_ALL}"
             )
             for ignored_file in ignored_files:
                 print(
-                    f"  - {os.path.basename(str(ignored_file))} (metadata/system file)"
+                    f"  - {os.path.basename(ignored_file)} (metadata/system file)"
                 )
 else:
     # os.makedirs(INPUT_AUDIO_FILE_DIR, exist_ok=True)
@@ -162,24 +193,49 @@ if not audio_file_exists:
     sys.exit(0)
 
 
+# Frames decoded per block when mixing multichannel files down to mono
+LOAD_BLOCK_FRAMES = 65536
+
+
 def load_audio_file(audio_file):
     print(
         f"{Fore.LIGHTCYAN_EX}Loading audio file:{Style.RESET_ALL} {os.path.basename(audio_file)}"
     )
 
     try:
-        # Load audio data and get original sample rate
-        audio_data_array, orig_sample_rate = sf.read(audio_file)
+        # Load audio data and get original sample rate.
+        # Decoded block by block into one float32 mono array (the stream dtype),
+        # so a multichannel file never sits in RAM in full
+        with sf.SoundFile(audio_file) as snd:
+            orig_sample_rate = snd.samplerate
+            channels = snd.channels
+            audio_data_array = np.empty(snd.frames, dtype=np.float32)
+            if channels == 1:
+                frames_read = len(snd.read(out=audio_data_array))
+            else:
+                block = np.empty((LOAD_BLOCK_FRAMES, channels), dtype=np.float32)
+                frames_read = 0
+                while frames_read < len(audio_data_array):
+                    chunk = snd.read(out=block)
+                    if len(chunk) == 0:
+                        break
+                    dst = audio_data_array[frames_read : frames_read + len(chunk)]
+                    if channels == 2:
+                        np.add(chunk[:, 0], chunk[:, 1], out=dst)
+                    else:
+                        np.add.reduce(chunk, axis=1, out=dst)
+                    frames_read += len(chunk)
+        audio_data_array = audio_data_array[:frames_read]
 
         print(f"  • Original sample rate: {orig_sample_rate} Hz")
         print(
-            f"  • Audio duration: {len(audio_data_array) / orig_sample_rate:.2f} seconds"
+            f"  • Audio duration: {frames_read / orig_sample_rate:.2f} seconds"
         )
-        print(f"  • Audio shape: {audio_data_array.shape}")
+        print(f"  • Audio shape: {(frames_read, channels) if channels > 1 else (frames_read,)}")
 
-        # Convert to mono if stereo
-        if len(audio_data_array.shape) > 1:
-            audio_data_array = np.mean(audio_data_array, axis=1)
+        # Sums -> mean for multichannel files
+        if channels > 1:
+            audio_data_array *= 1.0 / channels
             print("  • Converted to mono")
         return audio_data_array, orig_sample_rate
     except Exception as e:
@@ -226,6 +282,27 @@ def adjust_volume_db(audio_data, db_adjustment):
     return audio_data * amplitude_factor
 
 
+# sd.query_devices() result, queried once (each call re-enumerates every device),
+# plus the name lookups find_device_by_name needs, built alongside it
+_device_cache = None
+_name_to_index = {}
+_lower_names = []
+
+
+# [Utility]
+def _get_devices():
+    """Return sd.query_devices(), queried on first use and cached after that."""
+    global _device_cache, _name_to_index, _lower_names
+    if _device_cache is None:
+        _device_cache = sd.query_devices()
+        _name_to_index = {}
+        for i, device in enumerate(_device_cache):
+            # First device wins on duplicate names, like the old linear scan
+            _name_to_index.setdefault(device["name"], i)
+        _lower_names = [(i, device["name"].lower()) for i, device in enumerate(_device_cache)]
+    return _device_cache
+
+
 # [Utility]
 def find_device_by_name(device_name):
     """
@@ -237,19 +314,22 @@ def find_device_by_name(device_name):
     Returns:
         Index of the device or None if not found
     """
-    devices = sd.query_devices()
+    _get_devices()
 
     # Try exact match first
-    for i, device in enumerate(devices):
-        if device["name"] == device_name:
-            return i
+    index = _name_to_index.get(device_name)
+    if index is not None:
+        return index
+
+    # Try partial match (case-insensitive)
+    needle = device_name.lower()
+    return next((i for i, name in _lower_names if needle in name), None)
 
-    # Try partial match
-    for i, device in enumerate(devices):
-        if device_name.lower() in device["name"].lower():
-            return i
 
-    return None
+# Pre-formatted listing pieces (built once, not per device)
+_DEVICES_HEADER = f"\n{Fore.CYAN}Available Audio Output Devices:{Style.RESET_ALL}"
+_DEVICES_BAR = f"{Fore.CYAN}{'-' * 50}{Style.RESET_ALL}"
+_DEFAULT_MARKER = f" {Fore.GREEN}(DEFAULT){Style.RESET_ALL}"
 
 
 # [Utility]
@@ -260,33 +340,29 @@ def list_available_devices():
     Returns:
         List of output devices with their indices
     """
-    devices = sd.query_devices()
+    devices = _get_devices()
+    default_out = sd.default.device[1]
     output_devices = []
 
-    print(f"\n{Fore.CYAN}Available Audio Output Devices:{Style.RESET_ALL}")
-    print(f"{Fore.CYAN}" + "-" * 50 + f"{Style.RESET_ALL}")
+    # Collected and printed once instead of several prints per device
+    lines = [_DEVICES_HEADER, _DEVICES_BAR]
 
     for i, device in enumerate(devices):
         # Only consider output devices
         if device["max_output_channels"] > 0:
-            is_default = i == sd.default.device[1]
-            default_marker = (
-                f" {Fore.GREEN}(DEFAULT){Style.RESET_ALL}" if is_default else ""
-            )
+            default_marker = _DEFAULT_MARKER if i == default_out else ""
+            device_type = "Input & Output" if device["max_input_channels"] > 0 else "Output"
 
-            print(
+            lines.append(
                 f"{Fore.YELLOW}Device {i}: {device['name']}{default_marker}{Style.RESET_ALL}"
             )
-            print(f"  Channels: {device['max_output_channels']} out")
-            print(f"  Sample Rate: {device['default_samplerate']} Hz")
-            print(
-                f"  Device type: {'Input' if device['max_input_channels'] > 0 else ''}"
-                f"{' & ' if device['max_input_channels'] > 0 and device['max_output_channels'] > 0 else ''}"
-                f"{'Output' if device['max_output_channels'] > 0 else ''}"
-            )
+            lines.append(f"  Channels: {device['max_output_channels']} out")
+            lines.append(f"  Sample Rate: {device['default_samplerate']} Hz")
+            lines.append(f"  Device type: {device_type}")
             output_devices.append(i)
 
-    print(f"{Fore.CYAN}" + "-" * 50 + f"{Style.RESET_ALL}")
+    lines.append(_DEVICES_BAR)
+    print("\n".join(lines))
     return output_devices
 
 
@@ -312,7 +388,7 @@ def confirm_selected_device(device=None, target_channels=2, channel_mapping=None
         device_index = device
 
     # Validate device exists and is an output device
-    all_devices = sd.query_devices()
+    all_devices = _get_devices()
     if device_index >= len(all_devices):
         print(f"Device index {device_index} out of range. Using default.")
         device_index = sd.default.device[1]
@@ -321,7 +397,7 @@ def confirm_selected_device(device=None, target_channels=2, channel_mapping=None
         device_index = sd.default.device[1]
 
     # Get device info
-    device_info = sd.query_devices(device_index)
+    device_info = all_devices[device_index]
 
     # Check channel compatibility
     available_channels = device_info["max_output_channels"]
@@ -336,6 +412,115 @@ def confirm_selected_device(device=None, target_channels=2, channel_mapping=None
     return device_info, device_index, target_channels, channel_mapping
 
 
+# confirm_selected_device results by (device, target_channels, channel_mapping);
+# the config doesn't change while the script runs, so each setup resolves once
+_resolved_devices = {}
+
+
+# [Utility]
+def resolve_device(device=None, target_channels=2, channel_mapping=None):
+    """confirm_selected_device, memoized per argument set"""
+    key = (
+        device,
+        target_channels,
+        tuple(channel_mapping) if channel_mapping is not None else None,
+    )
+    resolved = _resolved_devices.get(key)
+    if resolved is None:
+        resolved = confirm_selected_device(
+            device=device,
+            target_channels=target_channels,
+            channel_mapping=channel_mapping,
+        )
+        _resolved_devices[key] = resolved
+    return resolved
+
+
+# [state] - Streaming position for play_audio_stream's callback
+class _PlaybackState:
+    """
+    Mono buffer, enabled output channels and read position for the stream
+    callback (plain attributes, no closure cells). Channels are expanded per
+    block, so no (samples x channels) copy of the file is ever built.
+    """
+
+    __slots__ = ("buffer", "columns", "pos", "total", "finished", "status_log")
+
+    def __init__(self):
+        self.finished = threading.Event()  # Set by PortAudio when the stream goes inactive
+        # Callback status flags, printed by the main thread (no stdout I/O on the audio thread)
+        self.status_log = deque(maxlen=32)
+        self.load(np.zeros(0, dtype=np.float32), ())
+
+    def load(self, buffer, columns):
+        """Point the callback at a new signal and rewind (stream must be stopped)"""
+        self.buffer = buffer
+        self.columns = columns
+        self.pos = 0
+        self.total = len(buffer)
+        self.finished.clear()
+        self.status_log.clear()
+
+    def callback(self, outdata, frames, time, status):
+        if status:
+            self.status_log.append(status)
+
+        pos = self.pos
+        n = min(pos + frames, self.total) - pos
+        block = self.buffer[pos : pos + n]
+        # Disabled channels and any tail past the end stay silent
+        outdata.fill(0)
+        # One indexed assignment covers every enabled channel
+        outdata[:n, self.columns] = block[:, None]
+        self.pos = pos + n
+        if self.pos >= self.total:
+            raise sd.CallbackStop
+
+
+# Open output streams, kept between plays so each play skips the PortAudio device
+# open/close: (device_index, samplerate, channels, blocksize, latency, dtype) -> (stream, state)
+_active_streams = {}
+
+
+# [state] - Reuse an open stream for the same device settings
+def _get_output_stream(
+    device_index, samplerate, channels, blocksize, latency, dtype="float32"
+):
+    """Return a stopped (stream, _PlaybackState) pair, opening the stream on first use."""
+    key = (device_index, samplerate, channels, blocksize, latency, dtype)
+    entry = _active_streams.get(key)
+    if entry is not None and not entry[0].closed:
+        entry[0].stop()  # No-op if already stopped; needed after CallbackStop
+        return entry
+
+    state = _PlaybackState()
+    stream = sd.OutputStream(
+        samplerate=samplerate,
+        channels=channels,
+        callback=state.callback,
+        finished_callback=state.finished.set,
+        device=device_index,  # Use the selected device
+        blocksize=blocksize,  # Fixed period: every block is a full slice until the end
+        latency=latency,
+        dtype=dtype,  # Same as the buffer: no conversion per block
+    )
+    _active_streams[key] = (stream, state)
+    return stream, state
+
+
+def _close_output_streams():
+    """Close every cached stream (registered with atexit)"""
+    for stream, _ in _active_streams.values():
+        try:
+            stream.close()
+        except Exception:
+            pass
+    _active_streams.clear()
+
+
+atexit.register(_close_output_streams)
+
+
 # [state] - Output channel and other feature ctrl
 def play_audio_stream(
     audio_file,
@@ -344,6 +529,8 @@ def play_audio_stream(
     target_sample_rate=48000,  # Should match output sound device's sample rate
     target_channels=2,
     channel_mapping=None,
+    blocksize=1024,  # Frames per callback (0 = let PortAudio choose)
+    latency="high",  # 'low', 'high' or seconds
 ):
     """
     Play audio using sounddevice.Stream with real-time transformation.
@@ -358,9 +545,12 @@ def play_audio_stream(
         target_sample_rate: Target sample rate
         target_channels: Number of channels for output
         channel_mapping: Which channels to play audio on (0-indexed)
+        blocksize: Frames per stream callback
+        latency: Requested PortAudio output latency
 
     Returns:
-        tuple: (success, transformed_audio)
+        tuple: (success, transformed_audio) - transformed_audio is the resampled,
+        volume-adjusted mono signal; channels are mapped while streaming
     """
 
     # Default channel mapping if not provided
@@ -369,7 +559,7 @@ def play_audio_stream(
 
     # Step 1: Validate device and parameters using utility function
     device_info, device_index, target_channels, channel_mapping = (
-        confirm_selected_device(
+        resolve_device(
             device=device,
             target_channels=target_channels,
             channel_mapping=channel_mapping,
@@ -377,43 +567,24 @@ def play_audio_stream(
     )
 
     # Step 2: Load the audio data
-    audio_data_orig, orig_sample_rate = load_audio_file(audio_file)
-
-    # Step 3: Apply volume adjustment
-    audio_data = adjust_volume_linear(audio_data_orig, volume_factor)
-
-    # Step 4: Resample the audio data
-    new_length = int(len(audio_data) * target_sample_rate / orig_sample_rate)
-    resampled_data = signal.resample(audio_data, new_length)
-
-    # Step 5: Apply channel mask
+    audio_data, orig_sample_rate = load_audio_file(audio_file)
+
+    # Step 3: Resample the audio data
+    # Polyphase filter (built-in Kaiser window): linear time, no whole-file FFT
+    # temporaries and no periodicity assumption (so no wrap-around artifacts)
+    g = math.gcd(int(target_sample_rate), int(orig_sample_rate))
+    resampled_data = signal.resample_poly(
+        audio_data, int(target_sample_rate) // g, int(orig_sample_rate) // g
+    ).astype(np.float32, copy=False)
+
+    # Step 4: Apply volume adjustment in place on the resampled buffer
+    # (resampling is linear, so scaling after it gives the same result)
+    np.multiply(resampled_data, volume_factor, out=resampled_data)
+
+    # Step 5: Channel mask, applied block by block in the callback
+    # (peak memory stays at one mono buffer instead of samples x channels)
     target_channels = len(channel_mapping)
-    multichannel_audio = np.zeros((len(resampled_data), target_channels))
-    # Apply the binary mask (multiply each channel by 0 or 1)
-    for channel_idx, enabled in enumerate(channel_mapping):
-        if enabled:
-            multichannel_audio[:, channel_idx] = resampled_data
-
-    # Step 6: Create callback for streaming
-    position = 0
-
-    def callback(outdata, frames, time, status):
-        nonlocal position
-
-        if status:
-            print(status)
-
-        # Check if we have enough data left
-        remaining = len(multichannel_audio) - position
-        if remaining < frames:
-            # Not enough data left, pad with zeros
-            outdata[:remaining] = multichannel_audio[position : position + remaining]
-            outdata[remaining:] = 0
-            raise sd.CallbackStop
-        else:
-            # Output the next chunk of audio
-            outdata[:] = multichannel_audio[position : position + frames]
-            position += frames
+    active_columns = np.flatnonzero(np.asarray(channel_mapping, dtype=np.int8))
 
     # Step 5: Create and start the stream
     print(f"{Fore.GREEN}Starting playback:{Style.RESET_ALL}")
@@ -426,30 +597,35 @@ def play_audio_stream(
     if device_info is not None:
         print(f"  • Device: {device_info['name']} (index {device_index})")
     else:
-        default_device = sd.query_devices(sd.default.device[1])
+        default_device = _get_devices()[sd.default.device[1]]
         print(f"  • Device: {default_device['name']} (default)")
 
     try:
-        with sd.OutputStream(
-            samplerate=target_sample_rate,
-            channels=target_channels,
-            callback=callback,
-            device=device_index,  # Use the selected device
-        ):
-            print(
-                f"Playing audio on {target_channels} channels at {target_sample_rate}Hz"
-            )
-            # print(f"Audio mapped to channels: {[ch + 1 for ch in channel_mapping]}")
-            print(
-                f"Audio mapped to channels: {active_channels} of {len(channel_mapping)} total"
-            )
+        # Step 6: Point the (possibly reused) stream's callback at this signal
+        stream, playback = _get_output_stream(
+            device_index, target_sample_rate, target_channels, blocksize, latency
+        )
+        playback.load(resampled_data, active_columns)
+        stream.start()
+        print(
+            f"Playing audio on {target_channels} channels at {target_sample_rate}Hz"
+        )
+        # print(f"Audio mapped to channels: {[ch + 1 for ch in channel_mapping]}")
+        print(
+            f"Audio mapped to channels: {active_channels} of {len(channel_mapping)} total"
+        )
 
-            # Calculate the wait time in milliseconds Wait until playback is finished
-            duration_ms = int(1000 * len(multichannel_audio) / target_sample_rate)
-            print(f"  • Duration: {duration_ms / 1000:.2f} seconds")
-            sd.sleep(duration_ms)
+        # Wait until the callback stops the stream (with some slack for the
+        # device buffers), rather than sleeping for a fixed duration
+        duration_ms = int(1000 * len(resampled_data) / target_sample_rate)
+        print(f"  • Duration: {duration_ms / 1000:.2f} seconds")
+        if not playback.finished.wait(timeout=duration_ms / 1000 + 0.5):
+            print(f"{Fore.YELLOW}Playback did not finish in time, stopping stream{Style.RESET_ALL}")
+            stream.stop()
+        while playback.status_log:
+            print(f"{Fore.YELLOW}Stream status: {playback.status_log.popleft()}{Style.RESET_ALL}")
         print(f"{Fore.GREEN}Playback complete!{Style.RESET_ALL}")
-        return True, multichannel_audio
+        return True, resampled_data
     except sd.PortAudioError as e:
         print(f"{Fore.RED}Error opening sound device: {e}{Style.RESET_ALL}")
         # If this is not the default device, try falling back to default
@@ -462,6 +638,8 @@ def play_audio_stream(
                 target_sample_rate=target_sample_rate,
                 target_channels=target_channels,
                 channel_mapping=channel_mapping,
+                blocksize=blocksize,
+                latency=latency,
             )
         return False, None
     except Exception as e:
@@ -481,7 +659,7 @@ def main():
 
     # 2. Validate device and parameters
     device_info, device_index, target_channels, channel_mapping = (
-        confirm_selected_device(
+        resolve_device(
             device=TARGET_SOUND_DEVICE,
             target_channels=TARGET_TOTAL_CHANNELS,
             channel_mapping=TARGET_CHANNEL_MASK,
@@ -508,6 +686,8 @@ def main():
         target_sample_rate=TARGET_SAMPLE_RATE,
         target_channels=TARGET_TOTAL_CHANNELS,
         channel_mapping=TARGET_CHANNEL_MASK,
+        blocksize=TARGET_BLOCKSIZE,
+        latency=TARGET_LATENCY,
     )
 
     if not success or transformed_audio is None:
@@ -1,25 +1,26 @@
 import sounddevice as sd
 
+# Section rules, built once
+RULE = "=" * 80
+SUBRULE = "-" * 40
+
 def diagnose_audio_devices():
     """Diagnose all audio devices and their host APIs"""
     
-    print("=" * 80)
-    print("AUDIO SYSTEM DIAGNOSTIC")
-    print("=" * 80)
+    # Report lines are collected and printed in one go per phase
+    lines = [RULE, "AUDIO SYSTEM DIAGNOSTIC", RULE]
     
     # 1. List all Host APIs
-    print("\n1. AVAILABLE HOST APIs:")
-    print("-" * 40)
+    lines += ["\n1. AVAILABLE HOST APIs:", SUBRULE]
     hostapis = sd.query_hostapis()
     for i, api in enumerate(hostapis):
-        print(f"  API {i}: {api['name']}")
-        print(f"    - Default Input Device: {api['default_input_device']}")
-        print(f"    - Default Output Device: {api['default_output_device']}")
-        print(f"    - Device Count: {api['devices']}")
+        lines.append(f"  API {i}: {api['name']}")
+        lines.append(f"    - Default Input Device: {api['default_input_device']}")
+        lines.append(f"    - Default Output Device: {api['default_output_device']}")
+        lines.append(f"    - Device Count: {api['devices']}")
     
     # 2. List all devices with their Host API
-    print("\n2. ALL AUDIO DEVICES BY HOST API:")
-    print("-" * 40)
+    lines += ["\n2. ALL AUDIO DEVICES BY HOST API:", SUBRULE]
     devices = sd.query_devices()
     
     # Group devices by Host API
@@ -40,16 +41,15 @@ def diagnose_audio_devices():
     
     # Print devices grouped by API
     for api_name, api_devices in devices_by_api.items():
-        print(f"\n{api_name}:")
+        lines.append(f"\n{api_name}:")
         for dev in api_devices:
             if dev['channels'] > 0:  # Only show output devices
-                print(f"  Device {dev['index']}: {dev['name']}")
-                print(f"    - Channels: {dev['channels']} out")
-                print(f"    - Sample Rate: {dev['sample_rate']} Hz")
+                lines.append(f"  Device {dev['index']}: {dev['name']}")
+                lines.append(f"    - Channels: {dev['channels']} out")
+                lines.append(f"    - Sample Rate: {dev['sample_rate']} Hz")
     
     # 3. Find your MADI devices specifically
-    print("\n3. MADI DEVICES ANALYSIS:")
-    print("-" * 40)
+    lines += ["\n3. MADI DEVICES ANALYSIS:", SUBRULE]
     madi_devices = []
     for i, device in enumerate(devices):
         if 'MADI' in device['name'] and device['max_output_channels'] > 0:
@@ -60,20 +60,22 @@ def diagnose_audio_devices():
                 'api': api_name,
                 'channels': device['max_output_channels']
             })
-            print(f"  Device {i}: {device['name']}")
-            print(f"    HOST API: {api_name}")
-            print(f"    Channels: {device['max_output_channels']}")
+            lines.append(f"  Device {i}: {device['name']}")
+            lines.append(f"    HOST API: {api_name}")
+            lines.append(f"    Channels: {device['max_output_channels']}")
+    
+    # Print the device report before the (possibly slow) stream tests
+    print("\n".join(lines))
     
     # 4. Test latency modes (since exclusive parameter isn't available)
-    print("\n4. TESTING LATENCY MODES FOR SHARING:")
-    print("-" * 40)
+    lines = ["\n4. TESTING LATENCY MODES FOR SHARING:", SUBRULE]
     
     # Find MADI (9-16) device
     target_device = None
     for i, device in enumerate(devices):
         if 'MADI (9-16)' in device['name'] and 'MADIface' in device['name']:
             target_device = i
-            print(f"Testing device {i}: {device['name']}")
+            lines.append(f"Testing device {i}: {device['name']}")
             break
     
     if target_device is not None:
@@ -81,18 +83,19 @@ def diagnose_audio_devices():
         try:
             stream = sd.OutputStream(device=target_device, latency='high')
             stream.close()
-            print("  ✓ High latency mode: SUPPORTED")
+            lines.append("  ✓ High latency mode: SUPPORTED")
         except Exception as e:
-            print(f"  ✗ High latency mode: FAILED - {e}")
+            lines.append(f"  ✗ High latency mode: FAILED - {e}")
         
         # Test with specific latency value
         try:
             stream = sd.OutputStream(device=target_device, latency=0.1)
             stream.close()
-            print("  ✓ 100ms latency: SUPPORTED")
+            lines.append("  ✓ 100ms latency: SUPPORTED")
         except Exception as e:
-            print(f"  ✗ 100ms latency: FAILED - {e}")
+            lines.append(f"  ✗ 100ms latency: FAILED - {e}")
     
+    print("\n".join(lines))
     return madi_devices
 
 if __name__ == "__main__":
@@ -102,9 +105,9 @@ if __name__ == "__main__":
     # Run diagnostic
     madi_devices = diagnose_audio_devices()
     
-    print("\n" + "=" * 80)
+    print("\n" + RULE)
     print("RECOMMENDATIONS:")
-    print("-" * 40)
+    print(SUBRULE)
     
     # Check if we found ASIO devices
     asio_found = False
@@ -14,6 +14,12 @@ devices_to_test = [
     {'id': 50, 'name': 'MADI (9-16) via WDM-KS', 'api': 'WDM-KS'},
 ]
 
+# Same stream settings for every device; no callback, so no callback thread is set up
+STREAM_PARAMS = dict(channels=8, samplerate=44100, blocksize=2048, latency='high')
+
+# Start from PortAudio's defaults so every open sees the same settings
+sd.default.reset()
+
 print("\nTesting each device for multi-instance capability...")
 print("-" * 80)
 
@@ -21,50 +27,38 @@ for device in devices_to_test:
     print(f"\nTesting Device {device['id']}: {device['name']}")
     print(f"Host API: {device['api']}")
     
+    streams = []
     try:
-        # Try to open first stream
+        # Open both streams first, then start them back to back
         print("  Opening first stream...", end="")
-        stream1 = sd.OutputStream(
-            device=device['id'],
-            channels=8,
-            samplerate=44100,
-            blocksize=2048,
-            latency='high'
-        )
-        stream1.start()
+        streams.append(sd.OutputStream(device=device['id'], **STREAM_PARAMS))
         print(" SUCCESS")
         
         # Try to open second stream on same device
         print("  Opening second stream...", end="")
-        stream2 = sd.OutputStream(
-            device=device['id'],
-            channels=8,
-            samplerate=44100,
-            blocksize=2048,
-            latency='high'
-        )
-        stream2.start()
+        streams.append(sd.OutputStream(device=device['id'], **STREAM_PARAMS))
         print(" SUCCESS")
         
-        print(f"  ✓ Device {device['id']} ({device['api']}) SUPPORTS SHARING!")
+        print("  Starting both streams...", end="")
+        for stream in streams:
+            stream.start()
+        print(" SUCCESS")
         
-        # Clean up
-        stream1.stop()
-        stream2.stop()
-        stream1.close()
-        stream2.close()
+        print(f"  ✓ Device {device['id']} ({device['api']}) SUPPORTS SHARING!")
         
     except Exception as e:
         print(f" FAILED")
         print(f"  ✗ Device {device['id']} ({device['api']}) does NOT support sharing")
         print(f"    Error: {str(e)[:100]}")
         
-        # Clean up first stream if it was opened
-        try:
-            stream1.stop()
-            stream1.close()
-        except:
-            pass
+    finally:
+        # Clean up whatever was opened for this device
+        for stream in streams:
+            try:
+                stream.stop()
+                stream.close()
+            except Exception:
+                pass
 
 print("\n" + "=" * 80)
 print("RECOMMENDATION:")